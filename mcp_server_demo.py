@@ -3,13 +3,29 @@ Demo MCP Server - Simuliert externe Dienste
 Beispiel: Slack-ähnlicher Server der Kommunikationszeiten tracked
 """
 from mcp.server.fastmcp import FastMCP
-from datetime import datetime, timedelta
+from datetime import date as date_cls
+from datetime import datetime, time, timedelta
+from functools import lru_cache
 import random
 
 # Erstelle MCP Server
 mcp = FastMCP("CommunicationTracker")
 
 
+def _rng(source: str, date: str) -> random.Random:
+    """Zufallsgenerator mit festem Seed pro Quelle und Datum.
+
+    Dadurch liefern wiederholte Aufrufe für dasselbe Datum dieselben Daten,
+    und die Tagesübersicht passt zu den einzelnen Tool-Ergebnissen.
+    """
+    return random.Random(f"{source}:{date}")
+
+
+def _parse_date(date: str) -> datetime:
+    """Parse YYYY-MM-DD via fromisoformat (C-implementiert, schneller als strptime)"""
+    return datetime.combine(date_cls.fromisoformat(date), time.min)
+
+
 @mcp.tool()
 def get_slack_activities(date: str = None) -> list[dict]:
     """
@@ -24,34 +40,46 @@ def get_slack_activities(date: str = None) -> list[dict]:
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
 
+    return [dict(a) for a in _slack_activities(date)]
+
+
+@lru_cache(maxsize=128)
+def _slack_activities(date: str) -> tuple[dict, ...]:
+    """Erzeuge (und cache) die Slack-Aktivitäten für ein Datum"""
+    rng = _rng("slack", date)
+
     # Simuliere Slack-Aktivitäten
     channels = ["#general", "#dev-team", "#project-x", "#random"]
     activities = []
 
-    base_date = datetime.strptime(date, "%Y-%m-%d")
+    base_date = _parse_date(date)
 
-    # Generiere 5-10 zufällige Aktivitäten
-    num_activities = random.randint(5, 10)
-    for i in range(num_activities):
-        hour = random.randint(8, 17)
-        minute = random.randint(0, 59)
-        duration = random.randint(5, 45)  # 5-45 Minuten
+    # Generiere 5-10 zufällige Aktivitäten (alle Zufallswerte in einem Aufruf je Feld)
+    num_activities = rng.randint(5, 10)
+    hours = rng.choices(range(8, 18), k=num_activities)
+    minutes = rng.choices(range(60), k=num_activities)
+    durations = rng.choices(range(5, 46), k=num_activities)  # 5-45 Minuten
+    picked_channels = rng.choices(channels, k=num_activities)
+    message_counts = rng.choices(range(1, 21), k=num_activities)
 
+    for hour, minute, duration, channel, message_count in zip(
+        hours, minutes, durations, picked_channels, message_counts
+    ):
         start_time = base_date.replace(hour=hour, minute=minute)
         end_time = start_time + timedelta(minutes=duration)
 
         activities.append({
-            "channel": random.choice(channels),
+            "channel": channel,
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat(),
             "duration_minutes": duration,
-            "message_count": random.randint(1, 20)
+            "message_count": message_count
         })
 
     # Sortiere nach Zeit
     activities.sort(key=lambda x: x["start_time"])
 
-    return activities
+    return tuple(activities)
 
 
 @mcp.tool()
@@ -68,24 +96,36 @@ def get_github_activities(date: str = None) -> list[dict]:
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
 
+    return [dict(a) for a in _github_activities(date)]
+
+
+@lru_cache(maxsize=128)
+def _github_activities(date: str) -> tuple[dict, ...]:
+    """Erzeuge (und cache) die GitHub-Aktivitäten für ein Datum"""
+    rng = _rng("github", date)
+
     repos = ["timetracker", "web-app", "api-service"]
     activity_types = ["commit", "pull_request", "code_review"]
 
     activities = []
-    base_date = datetime.strptime(date, "%Y-%m-%d")
-
-    num_activities = random.randint(3, 8)
-    for i in range(num_activities):
-        hour = random.randint(9, 18)
-        minute = random.randint(0, 59)
-        duration = random.randint(10, 90)
-
+    base_date = _parse_date(date)
+
+    num_activities = rng.randint(3, 8)
+    hours = rng.choices(range(9, 19), k=num_activities)
+    minutes = rng.choices(range(60), k=num_activities)
+    durations = rng.choices(range(10, 91), k=num_activities)
+    picked_repos = rng.choices(repos, k=num_activities)
+    picked_types = rng.choices(activity_types, k=num_activities)
+
+    for hour, minute, duration, repo, activity_type in zip(
+        hours, minutes, durations, picked_repos, picked_types
+    ):
         start_time = base_date.replace(hour=hour, minute=minute)
         end_time = start_time + timedelta(minutes=duration)
 
         activities.append({
-            "repo": random.choice(repos),
-            "type": random.choice(activity_types),
+            "repo": repo,
+            "type": activity_type,
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat(),
             "duration_minutes": duration
@@ -93,7 +133,7 @@ def get_github_activities(date: str = None) -> list[dict]:
 
     activities.sort(key=lambda x: x["start_time"])
 
-    return activities
+    return tuple(activities)
 
 
 @mcp.tool()
@@ -110,6 +150,14 @@ def get_calendar_events(date: str = None) -> list[dict]:
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
 
+    return [dict(e) for e in _calendar_events(date)]
+
+
+@lru_cache(maxsize=128)
+def _calendar_events(date: str) -> tuple[dict, ...]:
+    """Erzeuge (und cache) die Kalender-Termine für ein Datum"""
+    rng = _rng("calendar", date)
+
     meetings = [
         "Daily Standup",
         "Sprint Planning",
@@ -119,27 +167,41 @@ def get_calendar_events(date: str = None) -> list[dict]:
     ]
 
     events = []
-    base_date = datetime.strptime(date, "%Y-%m-%d")
+    base_date = _parse_date(date)
 
-    num_events = random.randint(2, 5)
-    for i in range(num_events):
-        hour = random.randint(9, 16)
-        duration = random.choice([30, 60, 90])
+    num_events = rng.randint(2, 5)
+    hours = rng.choices(range(9, 17), k=num_events)
+    durations = rng.choices([30, 60, 90], k=num_events)
+    titles = rng.choices(meetings, k=num_events)
+    attendees = rng.choices(range(2, 9), k=num_events)
 
+    for hour, duration, title, attendee_count in zip(hours, durations, titles, attendees):
         start_time = base_date.replace(hour=hour, minute=0)
         end_time = start_time + timedelta(minutes=duration)
 
         events.append({
-            "title": random.choice(meetings),
+            "title": title,
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat(),
             "duration_minutes": duration,
-            "attendees": random.randint(2, 8)
+            "attendees": attendee_count
         })
 
     events.sort(key=lambda x: x["start_time"])
 
-    return events
+    return tuple(events)
+
+
+def _aggregate(items, key_field: str = None) -> tuple[int, list[str]]:
+    """Summiere Minuten und sammle eindeutige Werte von key_field in einem Durchlauf"""
+    total_minutes = 0
+    distinct = {}
+    for item in items:
+        total_minutes += item["duration_minutes"]
+        if key_field is not None:
+            distinct[item[key_field]] = None
+
+    return total_minutes, list(distinct)
 
 
 @mcp.resource("summary://{date}")
@@ -153,13 +215,19 @@ def get_daily_summary(date: str) -> str:
     Returns:
         Formatted summary string
     """
-    slack = get_slack_activities(date)
-    github = get_github_activities(date)
-    calendar = get_calendar_events(date)
+    return _daily_summary(date)
+
+
+@lru_cache(maxsize=128)
+def _daily_summary(date: str) -> str:
+    """Erzeuge (und cache) die Tagesübersicht für ein Datum"""
+    slack = _slack_activities(date)
+    github = _github_activities(date)
+    calendar = _calendar_events(date)
 
-    total_slack_minutes = sum(a["duration_minutes"] for a in slack)
-    total_github_minutes = sum(a["duration_minutes"] for a in github)
-    total_meeting_minutes = sum(e["duration_minutes"] for e in calendar)
+    total_slack_minutes, slack_channels = _aggregate(slack, "channel")
+    total_github_minutes, github_repos = _aggregate(github, "repo")
+    total_meeting_minutes, _ = _aggregate(calendar)
 
     summary = f"""
 Activity Summary for {date}
@@ -168,12 +236,12 @@ Activity Summary for {date}
 Communication (Slack):
   - {len(slack)} sessions
   - {total_slack_minutes} minutes total
-  - Channels: {', '.join(set(a['channel'] for a in slack))}
+  - Channels: {', '.join(slack_channels)}
 
 Development (GitHub):
   - {len(github)} activities
   - {total_github_minutes} minutes total
-  - Repos: {', '.join(set(a['repo'] for a in github))}
+  - Repos: {', '.join(github_repos)}
 
 Meetings (Calendar):
   - {len(calendar)} events
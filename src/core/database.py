@@ -1,12 +1,106 @@
+import logging
 import os
 import sqlite3
-from datetime import datetime
+import weakref
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from threading import Lock
+from threading import Lock, RLock, local
 from typing import Any, Optional
 
+logger = logging.getLogger(__name__)
+
+# All columns of the activities table, in schema order
+ACTIVITY_COLUMNS = (
+    'id',
+    'timestamp',
+    'app_name',
+    'window_title',
+    'duration',
+    'category',
+    'project_id',
+    'is_idle',
+    'process_path',
+)
+
+# Schema version stored in PRAGMA user_version; bump when adding a migration
+SCHEMA_VERSION = 4
+
+# Marker for settings keys known to be absent from the settings table
+_MISSING: Any = object()
+
+
+def _adapt_datetime(value: datetime) -> str:
+    """Store datetimes as ISO text ("YYYY-MM-DD HH:MM:SS[.ffffff]")
+
+    Same format as sqlite3's built-in adapter, which is deprecated since
+    Python 3.12.
+    """
+    return value.isoformat(' ')
+
+
+def _convert_timestamp(value: bytes) -> datetime:
+    """Parse TIMESTAMP columns while rows are fetched (PARSE_DECLTYPES)"""
+    return datetime.fromisoformat(value.decode())
+
+
+sqlite3.register_adapter(datetime, _adapt_datetime)
+sqlite3.register_converter('TIMESTAMP', _convert_timestamp)
+
+
+class _ReadConnHolder:
+    """Holds one thread's read connection in the Database's thread-local
+
+    The thread-local drops the holder when its thread exits, which closes the
+    connection (see _close_read_conn).
+    """
+
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _close_read_conn(conn: sqlite3.Connection, conns: list, lock: Lock) -> None:
+    """Close a read connection whose thread exited, unless close() already did"""
+    with lock:
+        if not any(c is conn for c in conns):
+            return
+        conns[:] = [c for c in conns if c is not conn]
+    conn.close()
+
 
 class Database:
+    # SQL of the hot write/read paths. Passing the identical text on every call
+    # lets the connection's statement cache hand back the prepared statement.
+    _SQL_INSERT_ACTIVITY = '''
+        INSERT INTO activities (timestamp, app_name, window_title, duration, is_idle, process_path)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (timestamp, app_name, window_title, duration) DO NOTHING
+    '''
+    _SQL_ASSIGN_ACTIVITY = '''
+        UPDATE activities
+        SET project_id = ?
+        WHERE id = ?
+    '''
+    _SQL_ASSIGN_BY_TIMERANGE = '''
+        UPDATE activities
+        SET project_id = ?
+        WHERE timestamp >= ?
+          AND timestamp <= ?
+          AND app_name = ?
+    '''
+    _SQL_TOUCH_PROJECT = '''
+        UPDATE projects
+        SET last_used = ?
+        WHERE id = ?
+    '''
+    _SQL_GET_SETTING = 'SELECT value FROM settings WHERE key = ?'
+    _SQL_SET_SETTING = '''
+        INSERT OR REPLACE INTO settings (key, value)
+        VALUES (?, ?)
+    '''
+
     def __init__(self, db_path: Optional[str] = None):
         """Initialize SQLite database connection
 
@@ -35,75 +129,191 @@ class Database:
         # Store the path for reference
         self.db_path = str(final_db_path)
 
-        self.conn = sqlite3.connect(str(final_db_path), check_same_thread=False)
+        self.conn = self._connect('rwc')
         self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
 
         # Enable foreign key constraints (must be done for each connection)
         self.conn.execute("PRAGMA foreign_keys = ON")
 
-        # Thread safety lock for write operations
-        self._write_lock = Lock()
+        self._configure_connection()
+
+        # Log every statement the writer runs, only when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            self.conn.set_trace_callback(logger.debug)
+
+        # Thread safety lock for write operations. Reentrant, so a write method
+        # may call another one (or a helper that locks) while holding it.
+        self._write_lock = RLock()
+
+        # Per-thread read-only connections; in WAL mode they read concurrently
+        # with the writer instead of queueing behind it on self.conn. Each one
+        # is closed when its thread exits (thread pool threads expire when idle).
+        self._read_local = local()
+        self._read_conns: list[sqlite3.Connection] = []
+        self._read_conns_lock = Lock()
+
+        # Upper bound for activity durations, bounds the overlap range scan
+        # (loaded lazily on first write)
+        self._max_duration: Optional[int] = None
+        # Upper bound for the end time of every stored activity; an activity
+        # starting at or after it cannot overlap anything (loaded lazily too)
+        self._end_watermark: Optional[datetime] = None
+
+        # Values that only change through this class, cached to skip a query per call
+        self._social_media_project_id: Optional[int] = None
+        self._settings_cache: dict[str, Optional[str]] = {}
+        # Bumped by set_setting, guards the cache like _projects_version below
+        self._settings_version = 0
+        # Result of get_projects; the version counter is bumped by every project
+        # write so a read racing with a write never stores a stale list
+        self._projects_cache: Optional[list[dict[str, Any]]] = None
+        self._projects_version = 0
 
         self.create_tables()
 
-    def create_tables(self):
-        """Create database tables if they don't exist"""
-        cursor = self.conn.cursor()
+        # Refresh planner statistics (sqlite_stat1) for indexes whose tables
+        # changed noticeably; cheap when nothing needs analyzing
+        self.conn.execute("PRAGMA optimize")
 
-        # Projects table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS projects (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                color TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_used TIMESTAMP
-            )
-        ''')
+    def _configure_connection(self) -> None:
+        """Apply performance PRAGMAs to the write connection.
 
-        # Activities table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS activities (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP NOT NULL,
-                app_name TEXT NOT NULL,
-                window_title TEXT,
-                duration INTEGER NOT NULL,
-                category TEXT,
-                project_id INTEGER,
-                is_idle BOOLEAN DEFAULT 0,
-                process_path TEXT,
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE SET NULL
-            )
-        ''')
+        WAL lets readers (GUI) run concurrently with the tracker's writes, and
+        synchronous=NORMAL only syncs on checkpoints instead of on every commit.
+        In WAL mode this stays crash-safe; at most the last commits can be lost
+        on power failure. In-memory databases keep their default journal.
+        """
+        # Lets checkpoint() hand pages freed by deletes back to the file system.
+        # Only applies to new databases; existing ones switch via migration 4.
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
 
-        # Settings table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT
+        if self.db_path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA wal_autocheckpoint = 1000")
+
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        # Bound the work of ANALYZE run by PRAGMA optimize
+        self.conn.execute("PRAGMA analysis_limit = 1000")
+
+    def _connect(self, mode: str) -> sqlite3.Connection:
+        """Open a connection to the database file via a file: URI
+
+        The URI carries the open mode ('rwc' for the writer, 'ro' for readers)
+        from one absolute path. Shared cache is deliberately not used: it
+        replaces WAL's concurrent readers with table-level locking. PRAGMAs
+        that apply to readers and the writer alike are set here.
+        """
+        if self.db_path == ':memory:':
+            target, uri = self.db_path, False
+        else:
+            target, uri = f"{Path(self.db_path).resolve().as_uri()}?mode={mode}", True
+
+        conn = sqlite3.connect(
+            target,
+            uri=uri,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=256,
+        )
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -64000")  # ~64 MB page cache
+        # mmap is per connection; the report queries run on the readers
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+        conn.execute("PRAGMA busy_timeout = 5000")
+
+        return conn
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """Get the read-only connection for the calling thread (created lazily)
+
+        In-memory databases cannot be shared between connections, so reads use
+        the write connection there.
+        """
+        if self.db_path == ':memory:':
+            return self.conn
+
+        holder = getattr(self._read_local, 'holder', None)
+        if holder is None:
+            conn = self._connect('ro')
+            conn.row_factory = sqlite3.Row
+
+            with self._read_conns_lock:
+                self._read_conns.append(conn)
+            holder = _ReadConnHolder(conn)
+            # Not bound to self, so a thread outliving the Database keeps
+            # nothing but the connection alive
+            weakref.finalize(
+                holder, _close_read_conn, conn, self._read_conns, self._read_conns_lock
             )
-        ''')
+            self._read_local.holder = holder
 
-        # Create indexes for better performance
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_activities_timestamp
-            ON activities(timestamp)
-        ''')
+        return holder.conn
 
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_activities_project
-            ON activities(project_id)
-        ''')
+    def create_tables(self):
+        """Create database tables if they don't exist"""
+        with self._write_lock:
+            cursor = self.conn.cursor()
 
-        # Create unique index to prevent duplicate activities
-        cursor.execute('''
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_activity
-            ON activities(timestamp, app_name, window_title, duration)
-        ''')
+            # Projects table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS projects (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL,
+                    color TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_used TIMESTAMP
+                )
+            ''')
+
+            # Activities table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS activities (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TIMESTAMP NOT NULL,
+                    app_name TEXT NOT NULL,
+                    window_title TEXT,
+                    duration INTEGER NOT NULL,
+                    category TEXT,
+                    project_id INTEGER,
+                    is_idle BOOLEAN DEFAULT 0,
+                    process_path TEXT,
+                    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE SET NULL
+                )
+            ''')
+
+            # Settings table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            ''')
 
-        self.conn.commit()
-        cursor.close()
+            # Create indexes for better performance
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_activities_timestamp
+                ON activities(timestamp)
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_activities_project
+                ON activities(project_id)
+            ''')
+
+            # App + Zeitbereich (assign/delete_activities_by_timerange)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_activities_app_ts
+                ON activities(app_name, timestamp)
+            ''')
+
+            # Create unique index to prevent duplicate activities
+            cursor.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_activity
+                ON activities(timestamp, app_name, window_title, duration)
+            ''')
+
+            self.conn.commit()
+            cursor.close()
 
         # Run migrations
         self._run_migrations()
@@ -112,21 +322,65 @@ class Database:
         self._initialize_social_media_project()
 
     def _run_migrations(self):
-        """Run database migrations"""
-        cursor = self.conn.cursor()
-
-        # Migration: Add last_used column to projects table if it doesn't exist
-        cursor.execute("PRAGMA table_info(projects)")
-        columns = [column[1] for column in cursor.fetchall()]
+        """Run database migrations not yet recorded in PRAGMA user_version"""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
 
-        if 'last_used' not in columns:
-            with self._write_lock:
-                cursor.execute('''
-                    ALTER TABLE projects ADD COLUMN last_used TIMESTAMP
+        with self._write_lock:
+            if version < 1:
+                # Migration 1: Add last_used column to projects table if it doesn't exist
+                # (databases from before user_version was tracked may already have it)
+                columns = [
+                    column[1]
+                    for column in self.conn.execute("PRAGMA table_info(projects)")
+                ]
+                if 'last_used' not in columns:
+                    self.conn.execute('''
+                        ALTER TABLE projects ADD COLUMN last_used TIMESTAMP
+                    ''')
+
+            if version < 2:
+                # Migration 2: Partial index so recently used projects are read
+                # in last_used order without a sort step (needs the column above)
+                self.conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_projects_last_used
+                    ON projects(last_used DESC)
+                    WHERE last_used IS NOT NULL
                 ''')
-                self.conn.commit()
 
-        cursor.close()
+            if version < 3:
+                # Migration 3: Existing data gets planner statistics once, so the
+                # composite (app_name, timestamp) index is picked right away.
+                # Empty databases are left to PRAGMA optimize as they grow.
+                has_activities = self.conn.execute(
+                    'SELECT EXISTS (SELECT 1 FROM activities)'
+                ).fetchone()[0]
+                if has_activities:
+                    self.conn.execute('ANALYZE')
+
+            new_version = SCHEMA_VERSION
+
+            # Migration 4: Databases created before auto_vacuum=INCREMENTAL was
+            # set only change mode through a VACUUM. It runs before the version
+            # is stamped; if it fails (busy network drive, disk full) the
+            # database stays at version 3 and it is retried on the next start.
+            if (
+                version < 4
+                and self.db_path != ':memory:'
+                and self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2
+            ):
+                # VACUUM cannot run inside a transaction
+                self.conn.commit()
+                try:
+                    self.conn.execute("VACUUM")
+                except sqlite3.Error as e:
+                    logger.warning(f"VACUUM for incremental auto_vacuum failed: {e}")
+                    new_version = 3
+
+            # PRAGMA does not accept bound parameters
+            self.conn.execute(f"PRAGMA user_version = {new_version}")
+            self.conn.commit()
 
     def save_activity(
         self,
@@ -138,57 +392,137 @@ class Database:
         process_path: Optional[str] = None,
     ) -> int:
         """Save a tracked activity to the database"""
-        duration = int((end_time - start_time).total_seconds())
+        # The connection context manager commits, or rolls back on error
+        with self._write_lock, self.conn:
+            activity_id = self._insert_activity(
+                app_name, window_title, start_time, end_time, is_idle, process_path
+            )
+
+        return activity_id
+
+    def save_activities(self, activities: list[dict[str, Any]]) -> list[int]:
+        """Save several activities in a single transaction
+
+        Each dict takes the keyword arguments of save_activity. All rows share
+        one BEGIN IMMEDIATE ... COMMIT, so a batch costs one sync instead of one
+        per activity.
+
+        Returns:
+            IDs of the saved activities in input order (0 for skipped duplicates)
+        """
+        if not activities:
+            return []
 
         with self._write_lock:
-            cursor = self.conn.cursor()
             try:
-                # Check for overlapping activities
-                cursor.execute('''
-                    SELECT id, timestamp, duration
-                    FROM activities
-                    WHERE timestamp < ?
-                      AND datetime(timestamp, '+' || duration || ' seconds') > ?
-                ''', (end_time, start_time))
-
-                overlapping = cursor.fetchall()
-
-                if overlapping:
-                    # Shorten overlapping activities to prevent overlap
-                    for overlap in overlapping:
-                        overlap_id = overlap[0]
-                        overlap_start = datetime.fromisoformat(overlap[1]) if isinstance(overlap[1], str) else overlap[1]
-                        overlap_duration = overlap[2]
-
-                        # Calculate new duration to end when this activity starts
-                        new_duration = int((start_time - overlap_start).total_seconds())
-
-                        if new_duration > 0:
-                            cursor.execute('''
-                                UPDATE activities
-                                SET duration = ?
-                                WHERE id = ?
-                            ''', (new_duration, overlap_id))
-                        else:
-                            # Would result in 0 duration - delete it
-                            cursor.execute('DELETE FROM activities WHERE id = ?', (overlap_id,))
-
-                # Insert new activity
-                cursor.execute('''
-                    INSERT INTO activities (timestamp, app_name, window_title, duration, is_idle, process_path)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (start_time, app_name, window_title, duration, is_idle, process_path))
-
-                activity_id = cursor.lastrowid
+                self.conn.execute('BEGIN IMMEDIATE')
+                activity_ids = [
+                    self._insert_activity(
+                        activity['app_name'],
+                        activity['window_title'],
+                        activity['start_time'],
+                        activity['end_time'],
+                        activity.get('is_idle', False),
+                        activity.get('process_path'),
+                    )
+                    for activity in activities
+                ]
                 self.conn.commit()
-                cursor.close()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+        return activity_ids
 
-                return int(activity_id) if activity_id else 0
+    def _insert_activity(
+        self,
+        app_name: str,
+        window_title: str,
+        start_time: datetime,
+        end_time: datetime,
+        is_idle: bool,
+        process_path: Optional[str],
+    ) -> int:
+        """Resolve overlaps and insert one activity (without committing)
+
+        Runs on the hot tracking path, so statements go through conn.execute()
+        and the connection's statement cache instead of a dedicated cursor.
 
-            except sqlite3.IntegrityError:
-                # Duplicate activity - silently ignore
-                cursor.close()
-                return 0
+        Note:
+            Must be called with _write_lock held.
+        """
+        duration = int((end_time - start_time).total_seconds())
+
+        if self._max_duration is None:
+            row = self.conn.execute(
+                'SELECT COALESCE(MAX(duration), 0), MAX(timestamp) FROM activities'
+            ).fetchone()
+            self._max_duration = int(row[0])
+            # Latest start + longest duration is >= every stored end time
+            self._end_watermark = (
+                datetime.fromisoformat(row[1]) + timedelta(seconds=self._max_duration)
+                if row[1] is not None else None
+            )
+
+        # The tracker writes in time order, so the new activity usually starts
+        # after everything stored and the overlap statements can be skipped
+        if self._end_watermark is not None and start_time < self._end_watermark:
+            self._resolve_overlaps(start_time, end_time)
+
+        # Insert new activity; duplicates (idx_unique_activity) are skipped
+        # by SQLite instead of raising IntegrityError. The timestamp is passed
+        # as text, so the insert skips the adapter lookup.
+        cursor = self.conn.execute(
+            self._SQL_INSERT_ACTIVITY,
+            (start_time.isoformat(' '), app_name, window_title, duration, is_idle, process_path),
+        )
+        if cursor.rowcount == 0:
+            # Duplicate activity - silently ignore (lastrowid would be stale)
+            return 0
+
+        self._max_duration = max(self._max_duration, duration)
+        if self._end_watermark is None or end_time > self._end_watermark:
+            self._end_watermark = end_time
+
+        activity_id = cursor.lastrowid
+        return int(activity_id) if activity_id else 0
+
+    def _resolve_overlaps(self, start_time: datetime, end_time: datetime) -> None:
+        """Shorten or delete stored activities overlapping [start_time, end_time)
+
+        Note:
+            Must be called with _write_lock held.
+        """
+        # Resolve overlapping activities in two set-based statements. No activity
+        # is longer than _max_duration, so only rows starting within that window
+        # before start_time can overlap; bounding timestamp on both sides lets
+        # SQLite seek idx_activities_timestamp instead of evaluating datetime()
+        # per row. julianday() keeps milliseconds, so the rounded ms difference
+        # integer-divided by 1000 truncates like int(timedelta.total_seconds()).
+        overlap_params = (
+            end_time,
+            start_time - timedelta(seconds=self._max_duration),
+            start_time,
+        )
+
+        # Shorten overlapping activities to end when this activity starts
+        self.conn.execute('''
+            UPDATE activities
+            SET duration = CAST(ROUND((julianday(?) - julianday(timestamp)) * 86400000) AS INTEGER) / 1000
+            WHERE timestamp < ?
+              AND timestamp >= ?
+              AND datetime(timestamp, '+' || duration || ' seconds') > ?
+              AND CAST(ROUND((julianday(?) - julianday(timestamp)) * 86400000) AS INTEGER) / 1000 > 0
+        ''', (start_time, *overlap_params, start_time))
+
+        # Would result in 0 duration - delete them
+        self.conn.execute('''
+            DELETE FROM activities
+            WHERE timestamp < ?
+              AND timestamp >= ?
+              AND datetime(timestamp, '+' || duration || ' seconds') > ?
+              AND CAST(ROUND((julianday(?) - julianday(timestamp)) * 86400000) AS INTEGER) / 1000 <= 0
+        ''', (*overlap_params, start_time))
 
     def get_activities(
         self,
@@ -197,9 +531,40 @@ class Database:
         project_id: Optional[int] = None,
     ) -> list[dict[str, Any]]:
         """Retrieve activities with optional filters"""
-        cursor = self.conn.cursor()
+        return list(self.iter_activities(start_date, end_date, project_id))
 
-        query = 'SELECT * FROM activities WHERE 1=1'
+    def get_activities_for_day(self, day: date) -> list[dict[str, Any]]:
+        """Retrieve all activities of one calendar day, newest first
+
+        The day view's most common query; it always has the same filter shape,
+        so its statement is reused from the cache.
+        """
+        return self.get_activities(
+            start_date=datetime.combine(day, time.min),
+            end_date=datetime.combine(day, time.max),
+        )
+
+    def iter_activities(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        project_id: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream activities with optional filters, newest first
+
+        Rows are fetched from SQLite as the caller iterates, so large ranges are
+        never materialized as a whole. Pass a subset of ACTIVITY_COLUMNS to skip
+        columns the caller does not need (e.g. long window titles).
+        """
+        if columns is None:
+            columns = ACTIVITY_COLUMNS
+
+        unknown = set(columns) - set(ACTIVITY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown activity columns: {sorted(unknown)}")
+
+        query = f"SELECT {', '.join(columns)} FROM activities WHERE 1=1"
         params = []
 
         if start_date:
@@ -216,74 +581,92 @@ class Database:
 
         query += ' ORDER BY timestamp DESC'
 
-        cursor.execute(query, params)
-        activities = []
-
-        for row in cursor.fetchall():
-            activity = dict(row)
-            # Convert timestamp string to datetime object
-            if isinstance(activity['timestamp'], str):
-                activity['timestamp'] = datetime.fromisoformat(activity['timestamp'])
-            activities.append(activity)
-
-        cursor.close()
-
-        return activities
+        # Plain tuples are cheaper to build than sqlite3.Row; the column names
+        # are already known, so each row is zipped straight into its dict
+        columns = tuple(columns)
+        cursor = self._read_conn().cursor()
+        cursor.row_factory = None
+        try:
+            cursor.execute(query, params)
+
+            # TIMESTAMP columns arrive as datetime via the registered converter
+            for row in cursor:
+                yield dict(zip(columns, row))
+        finally:
+            cursor.close()
 
     def create_project(self, name: str, color: str = "#3498db") -> int:
         """Create a new project"""
         with self._write_lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO projects (name, color)
-                VALUES (?, ?)
-            ''', (name, color))
-
-            project_id = cursor.lastrowid
-            self.conn.commit()
-            cursor.close()
+            with self.conn:
+                project_id = self.conn.execute('''
+                    INSERT INTO projects (name, color)
+                    VALUES (?, ?)
+                ''', (name, color)).lastrowid
+            self._invalidate_projects()
 
         return int(project_id) if project_id else 0
 
     def get_projects(self) -> list[dict[str, Any]]:
         """Get all projects"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM projects ORDER BY name')
-        projects = [dict(row) for row in cursor.fetchall()]
-        cursor.close()
+        projects = self._projects_cache
+        if projects is None:
+            version = self._projects_version
+            cursor = self._read_conn().cursor()
+            cursor.execute('SELECT * FROM projects ORDER BY name')
+            projects = [dict(row) for row in cursor.fetchall()]
+            cursor.close()
 
-        return projects
+            # Under the lock, so _invalidate_projects cannot run between the
+            # version check and the store
+            with self._write_lock:
+                if version == self._projects_version:
+                    self._projects_cache = projects
+
+        # Copies, so callers may modify the dicts without touching the cache
+        return [dict(project) for project in projects]
+
+    def _invalidate_projects(self) -> None:
+        """Drop the cached project list after a write to the projects table
+
+        Note:
+            Must be called with _write_lock held and after the write committed;
+            a reader could otherwise cache the pre-commit list.
+        """
+        self._projects_version += 1
+        self._projects_cache = None
 
     def assign_activity_to_project(self, activity_id: int, project_id: int) -> None:
         """Assign an activity to a project"""
-        with self._write_lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                UPDATE activities
-                SET project_id = ?
-                WHERE id = ?
-            ''', (project_id, activity_id))
-
-            self.conn.commit()
-            cursor.close()
+        with self._write_lock, self.conn:
+            self.conn.execute(self._SQL_ASSIGN_ACTIVITY, (project_id, activity_id))
 
     def assign_multiple_activities_to_project(self, activity_ids: list[int], project_id: int) -> int:
         """Assign multiple activities to a project"""
         if not activity_ids:
             return 0
 
-        with self._write_lock:
-            cursor = self.conn.cursor()
-            placeholders = ','.join('?' * len(activity_ids))
-            cursor.execute(f'''
-                UPDATE activities
-                SET project_id = ?
-                WHERE id IN ({placeholders})
-            ''', [project_id] + activity_ids)
-
-            rows_affected = cursor.rowcount
-            self.conn.commit()
-            cursor.close()
+        with self._write_lock, self.conn:
+            # One fixed-shape statement (reused from the statement cache) instead of
+            # a dynamic IN-list that is re-parsed for every distinct batch size.
+            # All rows run in the same implicit transaction and share one commit.
+            rows_affected = self.conn.executemany(
+                self._SQL_ASSIGN_ACTIVITY,
+                [(project_id, activity_id) for activity_id in activity_ids],
+            ).rowcount
+
+        return rows_affected
+
+    def assign_activities_to_projects(self, assignments: Sequence[tuple[int, int]]) -> int:
+        """Assign activities to projects from (project_id, activity_id) pairs
+
+        All pairs run through one executemany in a single transaction.
+        """
+        if not assignments:
+            return 0
+
+        with self._write_lock, self.conn:
+            rows_affected = self.conn.executemany(self._SQL_ASSIGN_ACTIVITY, assignments).rowcount
 
         return rows_affected
 
@@ -292,33 +675,56 @@ class Database:
     ) -> int:
         """Assign all activities in a time range for a specific app to a project"""
         with self._write_lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                UPDATE activities
-                SET project_id = ?
-                WHERE timestamp >= ?
-                  AND timestamp <= ?
-                  AND app_name = ?
-            ''', (project_id, start_time, end_time, app_name))
-
-            rows_affected = cursor.rowcount
+            with self.conn:
+                # Both statements share one transaction and one commit. A trigger on
+                # activities.project_id would fire per row and also on automatic
+                # assignments, so the project is touched explicitly here.
+                rows_affected = self.conn.execute(
+                    self._SQL_ASSIGN_BY_TIMERANGE, (project_id, start_time, end_time, app_name)
+                ).rowcount
+
+                # Update last_used timestamp for the project if it's not None
+                if project_id is not None:
+                    self.conn.execute(self._SQL_TOUCH_PROJECT, (datetime.now(), project_id))
 
-            # Update last_used timestamp for the project if it's not None
             if project_id is not None:
-                cursor.execute('''
-                    UPDATE projects
-                    SET last_used = ?
-                    WHERE id = ?
-                ''', (datetime.now(), project_id))
+                self._invalidate_projects()
 
-            self.conn.commit()
-            cursor.close()
+        return rows_affected
+
+    def assign_activities_bulk(
+        self, timeranges: Sequence[tuple[datetime, datetime, str]], project_id: Optional[int]
+    ) -> int:
+        """Assign activities of several (start, end, app_name) ranges to a project
+
+        Same as calling assign_activities_by_timerange per range, but all ranges
+        run through one executemany in a single transaction.
+        """
+        if not timeranges:
+            return 0
+
+        with self._write_lock:
+            with self.conn:
+                rows_affected = self.conn.executemany(
+                    self._SQL_ASSIGN_BY_TIMERANGE,
+                    [
+                        (project_id, start_time, end_time, app_name)
+                        for start_time, end_time, app_name in timeranges
+                    ],
+                ).rowcount
+
+                # Update last_used timestamp for the project if it's not None
+                if project_id is not None:
+                    self.conn.execute(self._SQL_TOUCH_PROJECT, (datetime.now(), project_id))
+
+            if project_id is not None:
+                self._invalidate_projects()
 
         return rows_affected
 
     def get_recently_used_projects(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get recently used projects"""
-        cursor = self.conn.cursor()
+        cursor = self._read_conn().cursor()
         cursor.execute('''
             SELECT id, name, color, last_used
             FROM projects
@@ -334,24 +740,31 @@ class Database:
 
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get a setting value"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        result = cursor.fetchone()
-        cursor.close()
+        try:
+            value = self._settings_cache[key]
+        except KeyError:
+            version = self._settings_version
+            result = self._read_conn().execute(self._SQL_GET_SETTING, (key,)).fetchone()
+
+            # Missing keys are cached as _MISSING so the default still applies
+            value = result[0] if result else _MISSING
+
+            # A set_setting that committed meanwhile may already have cached a
+            # newer value; only store the result if none did
+            with self._write_lock:
+                if version == self._settings_version:
+                    self._settings_cache[key] = value
 
-        return result[0] if result else default
+        return default if value is _MISSING else value
 
     def set_setting(self, key: str, value: str) -> None:
         """Set a setting value"""
         with self._write_lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO settings (key, value)
-                VALUES (?, ?)
-            ''', (key, value))
+            with self.conn:
+                self.conn.execute(self._SQL_SET_SETTING, (key, value))
 
-            self.conn.commit()
-            cursor.close()
+            self._settings_version += 1
+            self._settings_cache[key] = value
 
     def _initialize_social_media_project(self) -> None:
         """Initialize the Social Media project if it doesn't exist"""
@@ -359,46 +772,86 @@ class Database:
         cursor.execute('SELECT id FROM projects WHERE name = ?', ('Social Media',))
         result = cursor.fetchone()
 
-        if not result:
+        if result:
+            self._social_media_project_id = result[0]
+        else:
             # Create Social Media project with a distinctive color
             with self._write_lock:
                 cursor.execute('''
                     INSERT INTO projects (name, color)
                     VALUES (?, ?)
                 ''', ('Social Media', '#e74c3c'))
+                self._social_media_project_id = cursor.lastrowid
                 self.conn.commit()
+                self._invalidate_projects()
 
         cursor.close()
 
     def get_social_media_project_id(self) -> Optional[int]:
-        """Get the ID of the Social Media project"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT id FROM projects WHERE name = ?', ('Social Media',))
-        result = cursor.fetchone()
-        cursor.close()
+        """Get the ID of the Social Media project
 
-        return result[0] if result else None
+        The ID is resolved once at startup; it only changes if the project is
+        deleted through delete_project.
+        """
+        return self._social_media_project_id
+
+    def delete_project(self, project_id: int) -> None:
+        """Delete a project (its activities become unassigned)"""
+        with self._write_lock:
+            with self.conn:
+                self.conn.execute('DELETE FROM projects WHERE id = ?', (project_id,))
+            self._invalidate_projects()
+
+            if project_id == self._social_media_project_id:
+                self._social_media_project_id = None
 
     def delete_activities_by_timerange(
         self, start_time: datetime, end_time: datetime, app_name: str
     ) -> int:
         """Delete all activities in a time range for a specific app"""
-        with self._write_lock:
-            cursor = self.conn.cursor()
-            cursor.execute('''
+        with self._write_lock, self.conn:
+            rows_affected = self.conn.execute('''
                 DELETE FROM activities
                 WHERE timestamp >= ?
                   AND timestamp <= ?
                   AND app_name = ?
-            ''', (start_time, end_time, app_name))
-
-            rows_affected = cursor.rowcount
-            self.conn.commit()
-            cursor.close()
+            ''', (start_time, end_time, app_name)).rowcount
 
         return rows_affected
 
+    def checkpoint(self) -> None:
+        """Release free pages and truncate the WAL file
+
+        The WAL otherwise only shrinks when all connections close, which a
+        tracker running for days rarely does.
+        """
+        with self._write_lock:
+            # execute() steps the statement only once, which frees a single
+            # page; executescript() runs it to completion
+            self.conn.executescript("PRAGMA incremental_vacuum;")
+            if self.db_path != ':memory:':
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def maintenance(self) -> None:
+        """Re-analyze all tables, then checkpoint
+
+        Meant for occasional use (e.g. a scheduled job); normal operation is
+        covered by PRAGMA optimize on open and close.
+        """
+        with self._write_lock:
+            self.conn.execute("ANALYZE")
+            self.conn.commit()
+            self.checkpoint()
+
     def close(self) -> None:
-        """Close database connection"""
+        """Close database connections"""
+        with self._read_conns_lock:
+            for conn in self._read_conns:
+                conn.close()
+            self._read_conns.clear()
+
         if self.conn:
+            with self._write_lock:
+                # Record statistics gathered from this session's queries
+                self.conn.execute("PRAGMA optimize")
             self.conn.close()
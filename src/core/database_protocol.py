@@ -6,7 +6,8 @@ following Uncle Bob's Clean Architecture principles.
 The protocol defines the boundary between the application logic and the database implementation.
 """
 
-from datetime import datetime
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime
 from typing import Any, Optional, Protocol
 
 
@@ -38,6 +39,18 @@ class DatabaseProtocol(Protocol):
         """
         ...
 
+    def save_activities(self, activities: list[dict[str, Any]]) -> list[int]:
+        """
+        Save several activities in a single transaction
+
+        Args:
+            activities: Dicts with the keyword arguments of save_activity
+
+        Returns:
+            IDs of the saved activities in input order
+        """
+        ...
+
     def get_activities(
         self,
         start_date: Optional[datetime] = None,
@@ -57,6 +70,39 @@ class DatabaseProtocol(Protocol):
         """
         ...
 
+    def get_activities_for_day(self, day: date) -> list[dict[str, Any]]:
+        """
+        Retrieve all activities of one calendar day, newest first
+
+        Args:
+            day: The calendar day
+
+        Returns:
+            List of activity dictionaries
+        """
+        ...
+
+    def iter_activities(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        project_id: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream activities with optional filters, newest first
+
+        Args:
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            project_id: Optional project ID filter
+            columns: Optional subset of activity columns to fetch (default: all)
+
+        Returns:
+            Iterator of activity dictionaries
+        """
+        ...
+
     def create_project(self, name: str, color: str = "#3498db") -> int:
         """
         Create a new project
@@ -79,6 +125,15 @@ class DatabaseProtocol(Protocol):
         """
         ...
 
+    def delete_project(self, project_id: int) -> None:
+        """
+        Delete a project; its activities become unassigned
+
+        Args:
+            project_id: ID of the project
+        """
+        ...
+
     def assign_activity_to_project(self, activity_id: int, project_id: int) -> None:
         """
         Assign an activity to a project
@@ -89,6 +144,33 @@ class DatabaseProtocol(Protocol):
         """
         ...
 
+    def assign_multiple_activities_to_project(
+        self, activity_ids: list[int], project_id: int
+    ) -> int:
+        """
+        Assign several activities to a project in one transaction
+
+        Args:
+            activity_ids: IDs of the activities
+            project_id: ID of the project
+
+        Returns:
+            Number of activities affected
+        """
+        ...
+
+    def assign_activities_to_projects(self, assignments: Sequence[tuple[int, int]]) -> int:
+        """
+        Assign activities to (possibly different) projects in one transaction
+
+        Args:
+            assignments: (project_id, activity_id) pairs
+
+        Returns:
+            Number of activities affected
+        """
+        ...
+
     def assign_activities_by_timerange(
         self,
         start_time: datetime,
@@ -110,6 +192,23 @@ class DatabaseProtocol(Protocol):
         """
         ...
 
+    def assign_activities_bulk(
+        self,
+        timeranges: Sequence[tuple[datetime, datetime, str]],
+        project_id: Optional[int],
+    ) -> int:
+        """
+        Assign activities of several time ranges to a project in one transaction
+
+        Args:
+            timeranges: (start_time, end_time, app_name) tuples
+            project_id: ID of the project (None removes the assignment)
+
+        Returns:
+            Number of activities affected
+        """
+        ...
+
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
         Get a setting value
@@ -173,6 +272,10 @@ class DatabaseProtocol(Protocol):
         """
         ...
 
+    def checkpoint(self) -> None:
+        """Release free pages and truncate the write-ahead log"""
+        ...
+
     def close(self) -> None:
         """Close database connection"""
         ...
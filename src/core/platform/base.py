@@ -0,0 +1,38 @@
+"""Base class for platform-specific activity trackers.
+
+ActivityTracker talks to the platform only through the methods defined here.
+"""
+
+from collections.abc import Callable
+from typing import Optional
+
+
+class PlatformTracker:
+    """Interface every platform-specific activity tracker implements."""
+
+    # Platforms that can report window changes set this and override
+    # start_foreground_hook/stop_foreground_hook; others are polled
+    supports_foreground_hook = False
+
+    def get_active_window(self) -> Optional[dict]:
+        """Get app_name, window_title and process_path of the active window."""
+        raise NotImplementedError
+
+    def get_idle_time(self) -> float:
+        """Get seconds since the last user input."""
+        raise NotImplementedError
+
+    def is_audio_playing(self) -> bool:
+        """Check whether any application is currently playing audio."""
+        return False
+
+    def start_foreground_hook(self, callback: Callable[[], None]) -> bool:
+        """Call callback whenever the foreground window changes.
+
+        Returns:
+            True if the hook is active, False if it could not be installed.
+        """
+        return False
+
+    def stop_foreground_hook(self) -> None:
+        """Remove the hook installed by start_foreground_hook."""
@@ -6,16 +6,110 @@ including active window detection, idle time measurement, and audio playback sta
 
 import ctypes
 import logging
+import ntpath
 import re
-from datetime import datetime
+import sys
+import time
+from collections.abc import Callable
+from ctypes import wintypes
+from threading import Event, Thread, local
 from typing import Optional
 
 import psutil
 import win32gui
 import win32process
 
+from .base import PlatformTracker
+
+try:
+    from pycaw.pycaw import AudioUtilities
+except ImportError:
+    AudioUtilities = None
+
 logger = logging.getLogger(__name__)
 
+if AudioUtilities is None:
+    logger.warning("pycaw not available for audio detection")
+
+# Browser window title formats, compiled once instead of on every poll
+# "Page Title - Google Chrome"
+_CHROMIUM_TITLE_RE = re.compile(r'^(.+?) - (?:Google Chrome|Microsoft Edge|Brave)$')
+# "Page Title - Mozilla Firefox"
+_FIREFOX_TITLE_RE = re.compile(r'^(.+?) - Mozilla Firefox(?: Private Browsing)?$')
+
+_CHROMIUM_EXES = frozenset({'chrome.exe', 'msedge.exe', 'brave.exe'})
+
+# Direct kernel32 bindings for the process image path, with HANDLE-sized
+# return types (the ctypes default int would truncate handles on 64-bit)
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+_kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+_kernel32.OpenProcess.restype = wintypes.HANDLE
+_kernel32.QueryFullProcessImageNameW.argtypes = (
+    wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)
+)
+_kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+_kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+_kernel32.CloseHandle.restype = wintypes.BOOL
+
+# WinEvent hook for foreground window and title changes
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+WM_QUIT = 0x0012
+
+WinEventProcType = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+_user32.SetWinEventHook.argtypes = (
+    wintypes.DWORD,
+    wintypes.DWORD,
+    wintypes.HMODULE,
+    WinEventProcType,
+    wintypes.DWORD,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+_user32.SetWinEventHook.restype = wintypes.HANDLE
+_user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+_user32.UnhookWinEvent.restype = wintypes.BOOL
+_user32.GetMessageW.argtypes = (
+    ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT
+)
+_user32.GetMessageW.restype = wintypes.BOOL
+_user32.PostThreadMessageW.argtypes = (
+    wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+)
+_user32.PostThreadMessageW.restype = wintypes.BOOL
+_user32.GetWindowTextW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+_user32.GetWindowTextW.restype = ctypes.c_int
+
+# Window titles are read into a reused per-thread buffer; longer titles are cut
+WINDOW_TITLE_MAX_CHARS = 512
+_title_buffers = local()
+
+
+def _get_window_text(hwnd: int) -> str:
+    """Read a window title with one GetWindowTextW call (no length query)."""
+    buffer = getattr(_title_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _title_buffers.buffer = ctypes.create_unicode_buffer(WINDOW_TITLE_MAX_CHARS)
+
+    length = _user32.GetWindowTextW(hwnd, buffer, WINDOW_TITLE_MAX_CHARS)
+    return buffer[:length]
+
 
 class LASTINPUTINFO(ctypes.Structure):
     """Windows LASTINPUTINFO structure for idle time detection."""
@@ -26,7 +120,7 @@ class LASTINPUTINFO(ctypes.Structure):
     ]
 
 
-class WindowsActivityTracker:
+class WindowsActivityTracker(PlatformTracker):
     """Windows-specific activity tracking using Win32 API.
 
     This class provides methods to track user activity on Windows systems,
@@ -34,15 +128,33 @@ class WindowsActivityTracker:
     measurement, and audio playback detection.
     """
 
-    @staticmethod
-    def get_active_window() -> Optional[dict]:
+    # ActivityTracker waits for foreground events instead of polling
+    supports_foreground_hook = True
+
+    _hook_thread: Optional[Thread] = None
+    _hook_thread_id: int = 0
+
+    # Audio state changes rarely; enumerating sessions costs several COM
+    # calls, so the result is reused for AUDIO_CACHE_SECONDS
+    AUDIO_CACHE_SECONDS = 5.0
+    _audio_checked_at: Optional[float] = None
+    _audio_playing = False
+
+    # Process info of the last foreground window. The owning process of a
+    # window never changes, so while (hwnd, pid) stays the same only the title
+    # has to be read again.
+    _last_window: Optional[tuple[int, int]] = None
+    _cached_app_name: Optional[str] = None
+    _cached_process_path: Optional[str] = None
+
+    @classmethod
+    def get_active_window(cls) -> Optional[dict]:
         """Get currently active window information.
 
         Returns:
             Dictionary with window information containing:
                 - app_name: Name of the application executable
                 - window_title: Title of the active window
-                - timestamp: Current datetime
                 - process_path: Full path to the executable
             Returns None if no window is active or on error.
         """
@@ -52,25 +164,37 @@ class WindowsActivityTracker:
                 return None
 
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            process = psutil.Process(pid)
-
-            window_title = win32gui.GetWindowText(hwnd)
-            app_name = process.name()
+            if cls._last_window != (hwnd, pid):
+                process_path = cls._get_process_image_path(pid)
+                if process_path:
+                    app_name = ntpath.basename(process_path)
+                else:
+                    # Fall back to psutil (e.g. pid 0/4 or protected processes)
+                    process = psutil.Process(pid)
+                    app_name, process_path = process.name(), process.exe()
+                cls._last_window = (hwnd, pid)
+                # Few distinct apps recur all day: interning lets the tracker's
+                # change check compare them by identity and share one object
+                cls._cached_app_name = sys.intern(app_name)
+                cls._cached_process_path = sys.intern(process_path) if process_path else process_path
+
+            window_title = _get_window_text(hwnd)
+            app_name = cls._cached_app_name
 
             # Enhanced browser tracking
-            browser_info = WindowsActivityTracker._get_browser_info(app_name, window_title)
+            browser_info = cls._get_browser_info(app_name, window_title)
             if browser_info:
                 window_title = browser_info
 
             return {
                 'app_name': app_name,
                 'window_title': window_title,
-                'timestamp': datetime.now(),
-                'process_path': process.exe()
+                'process_path': cls._cached_process_path
             }
 
         except psutil.NoSuchProcess:
             # Process terminated before we could get info
+            cls._last_window = None
             return None
         except psutil.AccessDenied:
             # No permission to access process
@@ -83,6 +207,113 @@ class WindowsActivityTracker:
             logger.warning(f"Unexpected error getting active window: {e}")
             return None
 
+    def start_foreground_hook(self, callback: Callable[[], None]) -> bool:
+        """Call callback whenever the foreground window or its title changes.
+
+        Installs out-of-context WinEvent hooks on a dedicated thread that pumps
+        the messages needed to deliver them. Title changes are included so
+        switching browser tabs is noticed without polling.
+
+        Args:
+            callback: Called on the hook thread; must be cheap and thread-safe
+
+        Returns:
+            True if the hook is active, False if it could not be installed.
+        """
+        if self._hook_thread and self._hook_thread.is_alive():
+            return True
+
+        ready = Event()
+        result: list[bool] = []
+        self._hook_thread = Thread(
+            target=self._run_foreground_hook, args=(callback, ready, result), daemon=True
+        )
+        self._hook_thread.start()
+        ready.wait(timeout=5)
+
+        return bool(result and result[0])
+
+    def stop_foreground_hook(self) -> None:
+        """Remove the hooks installed by start_foreground_hook."""
+        if not self._hook_thread:
+            return
+
+        if self._hook_thread_id:
+            _user32.PostThreadMessageW(self._hook_thread_id, WM_QUIT, 0, 0)
+        self._hook_thread.join(timeout=5)
+        self._hook_thread = None
+        self._hook_thread_id = 0
+
+    def _run_foreground_hook(
+        self, callback: Callable[[], None], ready: Event, result: list[bool]
+    ) -> None:
+        """Hook thread: install the WinEvent hooks and pump messages until WM_QUIT."""
+        self._hook_thread_id = _kernel32.GetCurrentThreadId()
+
+        def on_event(hook, event, hwnd, id_object, id_child, event_thread, event_time):
+            # Name changes fire for every object in every process; only the
+            # foreground window's own title matters
+            if event == EVENT_SYSTEM_FOREGROUND or (
+                id_object == OBJID_WINDOW and hwnd == win32gui.GetForegroundWindow()
+            ):
+                callback()
+
+        # The ctypes callback must stay referenced while the hooks exist
+        proc = WinEventProcType(on_event)
+        flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        hooks = [
+            _user32.SetWinEventHook(
+                EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND, None, proc, 0, 0, flags
+            ),
+            _user32.SetWinEventHook(
+                EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE, None, proc, 0, 0, flags
+            ),
+        ]
+
+        try:
+            if not all(hooks):
+                logger.warning("SetWinEventHook failed, falling back to polling")
+                result.append(False)
+                ready.set()
+                return
+
+            result.append(True)
+            ready.set()
+
+            msg = wintypes.MSG()
+            while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                pass
+        finally:
+            for hook in hooks:
+                if hook:
+                    _user32.UnhookWinEvent(hook)
+
+    @staticmethod
+    def _get_process_image_path(pid: int) -> Optional[str]:
+        """Get the full executable path of a process.
+
+        Uses OpenProcess + QueryFullProcessImageNameW directly, which is a
+        single handle round-trip compared to psutil's Process object setup.
+
+        Args:
+            pid: Process ID
+
+        Returns:
+            Full path to the executable, or None if the process cannot be queried.
+        """
+        handle = _kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+
+        try:
+            size = wintypes.DWORD(1024)
+            buffer = ctypes.create_unicode_buffer(size.value)
+            if not _kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+                return None
+            return buffer.value
+        finally:
+            _kernel32.CloseHandle(handle)
+
     @staticmethod
     def _get_browser_info(app_name: str, window_title: str) -> Optional[str]:
         """Extract browser tab information from window title.
@@ -98,33 +329,48 @@ class WindowsActivityTracker:
         app_lower = app_name.lower()
 
         # Chrome, Edge, Brave
-        if any(browser in app_lower for browser in ['chrome.exe', 'msedge.exe', 'brave.exe']):
-            # Window title format: "Page Title - Google Chrome"
-            match = re.match(r'^(.+?) - (?:Google Chrome|Microsoft Edge|Brave)$', window_title)
+        if app_lower in _CHROMIUM_EXES:
+            match = _CHROMIUM_TITLE_RE.match(window_title)
             if match:
                 return match.group(1)
 
         # Firefox
-        elif 'firefox.exe' in app_lower:
-            # Window title format: "Page Title - Mozilla Firefox"
-            match = re.match(r'^(.+?) - Mozilla Firefox(?: Private Browsing)?$', window_title)
+        elif app_lower == 'firefox.exe':
+            match = _FIREFOX_TITLE_RE.match(window_title)
             if match:
                 return match.group(1)
 
         return None
 
-    @staticmethod
-    def is_audio_playing() -> bool:
+    @classmethod
+    def is_audio_playing(cls) -> bool:
         """Check if any audio is currently playing on the system.
 
         Uses Windows Core Audio API via pycaw to detect active audio sessions.
+        The result is cached for AUDIO_CACHE_SECONDS.
 
         Returns:
             True if audio is playing, False otherwise or on error.
         """
-        try:
-            from pycaw.pycaw import AudioUtilities
+        now = time.monotonic()
+        if cls._audio_checked_at is not None and now - cls._audio_checked_at < cls.AUDIO_CACHE_SECONDS:
+            return cls._audio_playing
 
+        cls._audio_playing = cls._query_audio_playing()
+        cls._audio_checked_at = now
+        return cls._audio_playing
+
+    @staticmethod
+    def _query_audio_playing() -> bool:
+        """Enumerate audio sessions and check whether one is active.
+
+        Returns:
+            True if audio is playing, False otherwise or on error.
+        """
+        if AudioUtilities is None:
+            return False
+
+        try:
             sessions = AudioUtilities.GetAllSessions()
             for session in sessions:
                 volume = session.SimpleAudioVolume
@@ -136,9 +382,6 @@ class WindowsActivityTracker:
                         return True
             return False
 
-        except ImportError:
-            logger.warning("pycaw not available for audio detection")
-            return False
         except OSError as e:
             # COM error or audio service unavailable
             logger.debug(f"Audio detection error: {e}")
@@ -1,9 +1,10 @@
+import importlib
 import logging
 import platform
 import time
 from datetime import datetime
 from threading import Event, Lock, Thread
-from typing import Optional
+from typing import Callable, Optional
 
 from core.database_protocol import DatabaseProtocol
 from utils.config import should_ignore_activity
@@ -11,6 +12,14 @@ from utils.social_media_detector import SocialMediaDetector
 
 logger = logging.getLogger(__name__)
 
+# platform.system() -> (module relative to this package, tracker class);
+# None marks platforms without a tracker yet
+_PLATFORM_TRACKERS: dict[str, Optional[tuple[str, str]]] = {
+    'Windows': ('.platform.windows', 'WindowsActivityTracker'),
+    'Darwin': None,  # TODO: Implement macOS tracker
+    'Linux': None,  # TODO: Implement Linux tracker
+}
+
 
 class ActivityTracker:
     """Main activity tracker that works across platforms.
@@ -19,8 +28,18 @@ class ActivityTracker:
     thread-safe access to the current activity state.
     """
 
+    # Seconds between WAL checkpoints while tracking runs (daily)
+    CHECKPOINT_INTERVAL = 24 * 60 * 60
+
     def __init__(
-        self, database: DatabaseProtocol, poll_interval: int = 2, idle_threshold: int = 300
+        self,
+        database: DatabaseProtocol,
+        poll_interval: int = 2,
+        idle_threshold: int = 300,
+        flush_size: int = 50,
+        flush_interval: float = 30,
+        idle_check_interval: float = 30,
+        max_poll_interval: float = 10,
     ):
         """
         Initialize activity tracker.
@@ -29,19 +48,64 @@ class ActivityTracker:
             database: Database instance for storing activities
             poll_interval: How often to check for window changes (seconds)
             idle_threshold: Seconds of inactivity before marking as idle
+            flush_size: Number of finished activities buffered before they are
+                written in one transaction
+            flush_interval: Maximum seconds a finished activity stays buffered
+            idle_check_interval: With an event-driven platform tracker, how
+                often idle and audio state are checked between window events
+            max_poll_interval: Upper bound for the polling interval, which
+                grows while neither the window nor user input changes
         """
         self.database = database
         self.poll_interval = poll_interval
         self.idle_threshold = idle_threshold
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.idle_check_interval = idle_check_interval
+        self.max_poll_interval = max_poll_interval
+
+        # Current polling interval (backs off from poll_interval while nothing happens)
+        self._poll_delay = poll_interval
+
+        # Ticks left before idle time is read again. While the user is active
+        # the idle threshold cannot be reached within a few polls.
+        self._idle_skip_remaining = 0
 
         self._current_activity: Optional[dict] = None
+        # (app_name, window_title) of _current_activity, compared on every tick
+        self._current_key: Optional[tuple[str, str]] = None
         self._start_time: Optional[datetime] = None
+        # Monotonic counterpart of _start_time for the minimum duration check,
+        # unaffected by wall-clock jumps (NTP, DST)
+        self._start_monotonic: Optional[float] = None
+
+        # A window seen once but not yet confirmed by the next tick, with the
+        # wall-clock and monotonic time it was first seen. Titles that flicker
+        # for less than one tick (scrolling tabs, editor status) never become
+        # activities of their own.
+        self._candidate_key: Optional[tuple[str, str]] = None
+        self._candidate_since: Optional[tuple[datetime, float]] = None
         self._activity_lock = Lock()
 
+        # Finished activities waiting to be written (protected by _activity_lock)
+        self._pending_activities: list[dict] = []
+        self._pending_social_media: list[bool] = []
+        self._pending_since: Optional[float] = None
+
+        self._last_checkpoint = time.monotonic()
+
+        # Called (from the tracker thread) after buffered activities were
+        # written, so a view can refresh only when there is something new
+        self.on_activities_saved: Optional[Callable[[], None]] = None
+
         self.is_running = False
         self.stop_event = Event()
         self.tracker_thread: Optional[Thread] = None
 
+        # Set by the platform's foreground hook (if any) to wake the loop
+        self._window_changed = Event()
+        self._foreground_hook_active = False
+
         # Import platform-specific tracker
         self.platform_tracker = self._get_platform_tracker()
 
@@ -49,18 +113,17 @@ class ActivityTracker:
         """Get the appropriate platform-specific tracker"""
         system = platform.system()
 
-        if system == 'Windows':
-            from .platform.windows import WindowsActivityTracker
-            return WindowsActivityTracker()
-        elif system == 'Darwin':
-            # TODO: Implement macOS tracker
-            raise NotImplementedError("macOS tracking not yet implemented")
-        elif system == 'Linux':
-            # TODO: Implement Linux tracker
-            raise NotImplementedError("Linux tracking not yet implemented")
-        else:
+        if system not in _PLATFORM_TRACKERS:
             raise OSError(f"Unsupported platform: {system}")
 
+        tracker = _PLATFORM_TRACKERS[system]
+        if tracker is None:
+            raise NotImplementedError(f"{system} tracking not yet implemented")
+
+        module_name, class_name = tracker
+        module = importlib.import_module(module_name, __package__)
+        return getattr(module, class_name)()
+
     def start(self):
         """Start tracking in background thread"""
         if self.is_running:
@@ -68,6 +131,14 @@ class ActivityTracker:
 
         self.is_running = True
         self.stop_event.clear()
+        self._window_changed.clear()
+
+        # Prefer window events over polling when the platform supports them
+        if self.platform_tracker.supports_foreground_hook:
+            self._foreground_hook_active = self.platform_tracker.start_foreground_hook(
+                self._window_changed.set
+            )
+
         self.tracker_thread = Thread(target=self._track_loop, daemon=True)
         self.tracker_thread.start()
 
@@ -78,14 +149,34 @@ class ActivityTracker:
 
         self.is_running = False
         self.stop_event.set()
+        self._window_changed.set()
 
         # Save current activity before stopping
         with self._activity_lock:
             if self._current_activity and self._start_time:
-                self._save_current_activity()
+                try:
+                    self._save_current_activity()
+                except Exception as e:
+                    logger.error(f"Error saving activity on stop: {e}")
 
         if self.tracker_thread:
-            self.tracker_thread.join(timeout=5)
+            # The loop wakes on stop_event, so this only waits for the
+            # current iteration to finish
+            self.tracker_thread.join(timeout=2)
+
+        if self._foreground_hook_active:
+            self.platform_tracker.stop_foreground_hook()
+            self._foreground_hook_active = False
+
+        # Write everything still buffered, including rows queued by the
+        # loop's last iteration
+        with self._activity_lock:
+            try:
+                self._flush_pending()
+            except Exception as e:
+                logger.error(f"Error saving activities on stop: {e}")
+
+        self.database.checkpoint()
 
     def _track_loop(self):
         """Main tracking loop that monitors window changes and idle state.
@@ -108,31 +199,124 @@ class ActivityTracker:
 
                 with self._activity_lock:
                     # Check if activity changed
-                    if current and self._is_activity_different(current):
+                    changed = bool(current) and self._is_activity_different(current)
+                    switch = changed
+                    if not changed:
+                        self._candidate_key = None
+                    elif self._current_activity:
+                        key = (current['app_name'], current['window_title'])
+                        if key != self._candidate_key:
+                            # First sighting; switch once the next tick confirms it
+                            self._candidate_key = key
+                            self._candidate_since = (datetime.now(), time.monotonic())
+                            switch = False
+
+                    if switch:
+                        # One timestamp ends the previous activity and starts
+                        # the next one at the same instant; ticks without a
+                        # change need no wall-clock time at all. A confirmed
+                        # candidate starts when it was first seen.
+                        if self._candidate_key is not None:
+                            now, now_monotonic = self._candidate_since
+                            self._candidate_key = None
+                        else:
+                            now = datetime.now()
+                            now_monotonic = time.monotonic()
+
                         # Save previous activity
                         if self._current_activity and self._start_time:
-                            self._save_current_activity()
+                            self._save_current_activity(
+                                end_time=now, end_monotonic=now_monotonic
+                            )
 
                         # Start tracking new activity
                         self._current_activity = current
-                        self._start_time = datetime.now()
-
-                    # Check for idle time
-                    idle_time = self.platform_tracker.get_idle_time()
-                    is_audio_playing = self.platform_tracker.is_audio_playing()
+                        self._current_key = (current['app_name'], current['window_title'])
+                        self._start_time = now
+                        self._start_monotonic = now_monotonic
+
+                    # Check for idle time (None on ticks that skip the check)
+                    idle_time = self._read_idle_time()
+
+                    # Without input since the last tick the window rarely
+                    # changes, so poll less often; any change resets the interval
+                    if changed or (idle_time is not None and idle_time < self._poll_delay):
+                        self._poll_delay = self.poll_interval
+                    elif idle_time is not None:
+                        self._poll_delay = min(
+                            self._poll_delay * 1.5,
+                            self.max_poll_interval,
+                            self.idle_threshold / 2,
+                        )
 
                     # Consider idle only if: no input AND no audio playing
-                    if idle_time > self.idle_threshold and not is_audio_playing:
+                    if (
+                        idle_time is not None
+                        and idle_time > self.idle_threshold
+                        and not self.platform_tracker.is_audio_playing()
+                    ):
                         if self._current_activity and not self._current_activity.get('is_idle'):
                             # Mark as idle
                             self._save_current_activity(is_idle=True)
                             self._current_activity = None
+                            self._current_key = None
                             self._start_time = None
+                            self._start_monotonic = None
+                            self._candidate_key = None
+
+                    if (
+                        self._pending_since is not None
+                        and time.monotonic() - self._pending_since >= self.flush_interval
+                    ):
+                        self._flush_pending()
+
+                if time.monotonic() - self._last_checkpoint >= self.CHECKPOINT_INTERVAL:
+                    self._last_checkpoint = time.monotonic()
+                    self.database.checkpoint()
 
             except Exception as e:
                 logger.error(f"Error in tracking loop: {e}")
 
-            time.sleep(self.poll_interval)
+            self._wait_for_next_tick()
+
+    def _read_idle_time(self) -> Optional[float]:
+        """Read the idle time, or return None if this tick skips the check.
+
+        While polling at the base interval, the number of skipped ticks is
+        chosen so that at most half the distance to idle_threshold passes
+        before the next read (capped at 10 ticks).
+        """
+        if self._idle_skip_remaining > 0:
+            self._idle_skip_remaining -= 1
+            return None
+
+        idle_time = self.platform_tracker.get_idle_time()
+        if not self._foreground_hook_active and self._poll_delay == self.poll_interval:
+            self._idle_skip_remaining = max(
+                0, min(10, int((self.idle_threshold - idle_time) / self.poll_interval / 2))
+            )
+
+        return idle_time
+
+    def _wait_for_next_tick(self) -> None:
+        """Block until the next loop iteration is due.
+
+        With a foreground hook the loop sleeps until a window/title change (or
+        idle_check_interval for idle and audio checks); otherwise it polls.
+        """
+        if self._foreground_hook_active:
+            # An unconfirmed window switch is rechecked after poll_interval
+            if self._candidate_key is not None:
+                self._window_changed.wait(self.poll_interval)
+            else:
+                self._window_changed.wait(self.idle_check_interval)
+            # A window switch fires several events at once; let the burst
+            # settle so it costs one iteration
+            self.stop_event.wait(0.1)
+            self._window_changed.clear()
+        else:
+            # Returns immediately when stop() sets the event
+            self.stop_event.wait(self._poll_delay)
 
     def _is_activity_different(self, new_activity: dict) -> bool:
         """Check if the new activity is different from current.
@@ -146,19 +330,23 @@ class ActivityTracker:
         Note:
             Must be called with _activity_lock held.
         """
-        if not self._current_activity:
-            return True
+        return self._current_key != (new_activity['app_name'], new_activity['window_title'])
 
-        return (
-            new_activity['app_name'] != self._current_activity['app_name'] or
-            new_activity['window_title'] != self._current_activity['window_title']
-        )
+    def _save_current_activity(
+        self,
+        is_idle: bool = False,
+        end_time: Optional[datetime] = None,
+        end_monotonic: Optional[float] = None,
+    ) -> None:
+        """Queue the current activity for saving to the database.
 
-    def _save_current_activity(self, is_idle: bool = False) -> None:
-        """Save the current activity to database.
+        Activities are buffered and written in one transaction once flush_size
+        activities are pending, after flush_interval seconds or on stop().
 
         Args:
             is_idle: Whether this activity should be marked as idle time
+            end_time: End of the activity (default: now)
+            end_monotonic: time.monotonic() value matching end_time (default: now)
 
         Note:
             Must be called with _activity_lock held.
@@ -166,29 +354,65 @@ class ActivityTracker:
         if not self._current_activity or not self._start_time:
             return
 
-        end_time = datetime.now()
+        if end_monotonic is None:
+            end_monotonic = time.monotonic()
 
         # Only save if duration is at least 1 second
-        if (end_time - self._start_time).total_seconds() >= 1:
-            activity_id = self.database.save_activity(
-                app_name=self._current_activity['app_name'],
-                window_title=self._current_activity['window_title'],
-                start_time=self._start_time,
-                end_time=end_time,
-                is_idle=is_idle,
-                process_path=self._current_activity.get('process_path')
-            )
-
-            # Auto-assign to Social Media project if detected
-            if activity_id and SocialMediaDetector.is_social_media(
+        if end_monotonic - self._start_monotonic >= 1:
+            if end_time is None:
+                end_time = datetime.now()
+
+            self._pending_activities.append({
+                'app_name': self._current_activity['app_name'],
+                'window_title': self._current_activity['window_title'],
+                'start_time': self._start_time,
+                'end_time': end_time,
+                'is_idle': is_idle,
+                'process_path': self._current_activity.get('process_path'),
+            })
+            self._pending_social_media.append(SocialMediaDetector.is_social_media(
                 self._current_activity['app_name'],
                 self._current_activity['window_title']
-            ):
-                social_media_project_id = self.database.get_social_media_project_id()
-                if social_media_project_id:
-                    self.database.assign_activity_to_project(
-                        activity_id, social_media_project_id
-                    )
+            ))
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+
+            if len(self._pending_activities) >= self.flush_size:
+                self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write all buffered activities in a single transaction.
+
+        Note:
+            Must be called with _activity_lock held.
+        """
+        if not self._pending_activities:
+            return
+
+        activity_ids = self.database.save_activities(self._pending_activities)
+
+        # Only drop the batch once it is written, so a failed write is
+        # retried on the next tick
+        social_media = self._pending_social_media
+        self._pending_activities = []
+        self._pending_social_media = []
+        self._pending_since = None
+
+        # Auto-assign to Social Media project if detected
+        social_media_ids = [
+            activity_id
+            for activity_id, is_social in zip(activity_ids, social_media)
+            if activity_id and is_social
+        ]
+        if social_media_ids:
+            social_media_project_id = self.database.get_social_media_project_id()
+            if social_media_project_id:
+                self.database.assign_multiple_activities_to_project(
+                    social_media_ids, social_media_project_id
+                )
+
+        if self.on_activities_saved is not None:
+            self.on_activities_saved()
 
     def get_current_activity(self) -> Optional[dict]:
         """Get the current activity being tracked (thread-safe).
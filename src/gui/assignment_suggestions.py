@@ -4,16 +4,17 @@ KI-Zuordnungs-Dialog für intelligente Projektzuordnung
 
 from datetime import datetime, timedelta
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QEvent, QObject, Qt
+from PyQt6.QtGui import QFont, QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
     QDialog,
     QHBoxLayout,
     QLabel,
+    QListWidget,
+    QListWidgetItem,
     QPushButton,
-    QScrollArea,
     QVBoxLayout,
     QWidget,
 )
@@ -25,6 +26,25 @@ from utils.smart_project_assigner import SmartProjectAssigner
 class AssignmentSuggestionsDialog(QDialog):
     """Dialog zur Anzeige und Bestätigung von KI-Projektzuordnungen"""
 
+    # Ein gemeinsames Stylesheet für alle Karten; die Auswahl wird über die
+    # dynamische Property "selected" umgeschaltet statt per setStyleSheet je Karte
+    CARD_STYLESHEET = (
+        'QWidget[suggestionCard="true"] { background-color: #f8f9fa; border: 1px solid #dee2e6; '
+        'border-radius: 5px; padding: 10px; margin: 2px; } '
+        'QWidget[suggestionCard="true"]:hover { background-color: #e9ecef; border-color: #adb5bd; } '
+        'QWidget[suggestionCard="true"][selected="true"] { border: 3px solid #27ae60; } '
+        'QWidget[suggestionCard="true"][selected="true"]:hover { border-color: #1e8449; } '
+        # Konfidenz-Badges: Farbe über die Property "badgeColor" (siehe get_confidence_color)
+        + ''.join(
+            f'QLabel[badgeColor="{color}"] {{ background-color: {color}; color: white; '
+            f'padding: 3px 8px; border-radius: 3px; font-weight: bold; }} '
+            for color in ("#27ae60", "#f39c12", "#e74c3c")
+        )
+    )
+
+    # Karten werden seitenweise erstellt, sobald der Nutzer ans Ende scrollt
+    PAGE_SIZE = 20
+
     def __init__(self, database: DatabaseProtocol, parent=None):
         super().__init__(parent)
         self.database = database
@@ -32,8 +52,12 @@ class AssignmentSuggestionsDialog(QDialog):
         self.suggestions = []
         self.selected_suggestions = set()
         self.projects = []  # Alle verfügbaren Projekte
+        self.project_by_id = {}  # Map: project_id -> Projekt
+        self.project_index_by_id = {}  # Map: project_id -> Index in der ComboBox
+        self.project_model = QStandardItemModel(self)  # Gemeinsames Modell aller ComboBoxen
         self.widget_map = {}  # Map: index -> widget für Style-Updates
         self.last_clicked_index = None  # Für Shift-Klick Bereichsauswahl
+        self.loading_widgets = False  # True während load_more_widgets läuft
 
         self.setup_ui()
         self.load_suggestions()
@@ -65,17 +89,23 @@ class AssignmentSuggestionsDialog(QDialog):
         info.setStyleSheet("color: #7f8c8d; margin: 10px 0;")
         layout.addWidget(info)
 
-        # Scroll Area für Vorschläge
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Liste für Vorschläge: eine Zeile pro Karte. Alle Karten sind gleich
+        # hoch, dadurch muss Qt beim Scrollen/Resize nicht jede Zeile vermessen.
+        # Die Auswahl wird selbst verwaltet (selected_suggestions).
+        self.suggestions_widget = QListWidget()
+        self.suggestions_widget.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        self.suggestions_widget.setUniformItemSizes(True)
+        self.suggestions_widget.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
+        self.suggestions_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.suggestions_widget.setStyleSheet(self.CARD_STYLESHEET)
 
-        self.suggestions_widget = QWidget()
-        self.suggestions_layout = QVBoxLayout(self.suggestions_widget)
-        self.suggestions_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        scrollbar = self.suggestions_widget.verticalScrollBar()
+        scrollbar.valueChanged.connect(self.load_more_if_needed)
+        # Auch wenn die erste Seite den sichtbaren Bereich nicht füllt
+        scrollbar.rangeChanged.connect(self.load_more_if_needed)
+        self.scrollbar = scrollbar
 
-        scroll.setWidget(self.suggestions_widget)
-        layout.addWidget(scroll)
+        layout.addWidget(self.suggestions_widget)
 
         # Button Bar
         button_layout = QHBoxLayout()
@@ -107,6 +137,14 @@ class AssignmentSuggestionsDialog(QDialog):
         """Lade KI-Vorschläge"""
         # Lade alle Projekte
         self.projects = self.database.get_projects()
+        self.project_by_id = {p["id"]: p for p in self.projects}
+        self.project_index_by_id = {p["id"]: i for i, p in enumerate(self.projects)}
+
+        # Projektliste einmal aufbauen; alle Karten-ComboBoxen teilen das Modell
+        for project in self.projects:
+            item = QStandardItem(f"  {project['name']}")
+            item.setData(project['id'], Qt.ItemDataRole.UserRole)
+            self.project_model.appendRow(item)
 
         # Hole Vorschläge für die letzten 7 Tage
         end_date = datetime.now()
@@ -123,34 +161,64 @@ class AssignmentSuggestionsDialog(QDialog):
             no_suggestions.setStyleSheet(
                 "color: #7f8c8d; padding: 20px; font-size: 14px;"
             )
-            self.suggestions_layout.addWidget(no_suggestions)
+            self.add_list_row(no_suggestions)
             self.apply_btn.setEnabled(False)
             return
 
-        # Erstelle Widget für jeden Vorschlag
-        for i, suggestion in enumerate(self.suggestions):
-            suggestion_widget = self.create_suggestion_widget(i, suggestion)
-            self.suggestions_layout.addWidget(suggestion_widget)
-            self.widget_map[i] = suggestion_widget
-
         # Alle standardmäßig auswählen (außer sehr niedrige Konfidenz)
         for i, suggestion in enumerate(self.suggestions):
             if suggestion["confidence"] >= 0.5:
                 self.selected_suggestions.add(i)
 
-        self.update_checkboxes()
-        self.update_all_widget_styles()
+        # Nur die erste Seite sofort erstellen, der Rest folgt beim Scrollen
+        self.load_more_widgets()
         self.update_button_text()
 
+    def load_more_widgets(self):
+        """Erstelle Widgets für die nächste Seite von Vorschlägen"""
+        start = len(self.widget_map)
+        end = min(start + self.PAGE_SIZE, len(self.suggestions))
+
+        # Jede neue Zeile ändert den Scrollbereich; load_more_if_needed darf
+        # währenddessen nicht erneut laden
+        self.loading_widgets = True
+        try:
+            for i in range(start, end):
+                suggestion_widget = self.create_suggestion_widget(i, self.suggestions[i])
+                self.widget_map[i] = suggestion_widget
+                self.add_list_row(suggestion_widget)
+
+                # Auswahl-Status übernehmen (ohne toggle_suggestion auszulösen)
+                checkbox = suggestion_widget.checkbox
+                checkbox.blockSignals(True)
+                checkbox.setChecked(i in self.selected_suggestions)
+                checkbox.blockSignals(False)
+                self.update_widget_style(i)
+        finally:
+            self.loading_widgets = False
+
+    def add_list_row(self, widget: QWidget):
+        """Füge ein Widget als eigene Zeile an die Vorschlagsliste an"""
+        item = QListWidgetItem(self.suggestions_widget)
+        item.setSizeHint(widget.sizeHint())
+        self.suggestions_widget.setItemWidget(item, widget)
+
+    def load_more_if_needed(self, *_):
+        """Lade weitere Karten, wenn das Ende der Liste (fast) erreicht ist"""
+        if self.loading_widgets or len(self.widget_map) >= len(self.suggestions):
+            return
+
+        if self.scrollbar.value() >= self.scrollbar.maximum() - self.scrollbar.pageStep() // 2:
+            self.load_more_widgets()
+
     def create_suggestion_widget(self, index: int, suggestion: dict) -> QWidget:
         """Erstellt Widget für einen einzelnen Vorschlag"""
         widget = QWidget()
         widget.setObjectName(f"suggestion_card_{index}")  # Unique identifier
-        widget.setStyleSheet(
-            f"QWidget#suggestion_card_{index} {{ background-color: #f8f9fa; border: 1px solid #dee2e6; "
-            f"border-radius: 5px; padding: 10px; margin: 2px; }} "
-            f"QWidget#suggestion_card_{index}:hover {{ background-color: #e9ecef; border-color: #adb5bd; }}"
-        )
+        # Style kommt aus CARD_STYLESHEET des Containers
+        widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        widget.setProperty("suggestionCard", True)
+        widget.setProperty("selected", False)
         widget.setCursor(Qt.CursorShape.PointingHandCursor)
 
         layout = QVBoxLayout(widget)
@@ -170,10 +238,7 @@ class AssignmentSuggestionsDialog(QDialog):
         confidence = suggestion["confidence"]
         confidence_color = self.get_confidence_color(confidence)
         confidence_badge = QLabel(f"Konfidenz: {suggestion['confidence_percent']}")
-        confidence_badge.setStyleSheet(
-            f"background-color: {confidence_color}; color: white; "
-            f"padding: 3px 8px; border-radius: 3px; font-weight: bold;"
-        )
+        confidence_badge.setProperty("badgeColor", confidence_color)
         top_row.addWidget(confidence_badge)
 
         top_row.addStretch()
@@ -230,23 +295,16 @@ class AssignmentSuggestionsDialog(QDialog):
             "selection-background-color: #3498db; selection-color: white; }"
         )
 
-        # Fülle ComboBox mit allen Projekten
-        for project in self.projects:
-            project_combo.addItem(f"  {project['name']}", project['id'])
+        # Alle Projekte aus dem gemeinsamen Modell
+        project_combo.setModel(self.project_model)
 
         # Setze vorgeschlagenes Projekt als Standard (BEVOR Signal verbunden wird!)
-        suggested_project_id = suggestion["suggested_project_id"]
-        for i in range(project_combo.count()):
-            if project_combo.itemData(i) == suggested_project_id:
-                project_combo.setCurrentIndex(i)
-                break
+        combo_index = self.project_index_by_id.get(suggestion["suggested_project_id"])
+        if combo_index is not None:
+            project_combo.setCurrentIndex(combo_index)
 
         # Verhindere Click-Propagation zum Widget (stoppt Checkbox-Toggle beim ComboBox-Klick)
-        def combo_mouse_press(event):
-            event.accept()  # Stoppt Event-Propagation
-            QComboBox.mousePressEvent(project_combo, event)  # Führe normale ComboBox-Funktion aus
-
-        project_combo.mousePressEvent = combo_mouse_press
+        project_combo.setAttribute(Qt.WidgetAttribute.WA_NoMousePropagation)
 
         # Signal-Handler NACH dem Setzen des Standard-Index verbinden!
         # Dadurch wird der Handler nicht beim initialen Setzen aufgerufen
@@ -261,16 +319,27 @@ class AssignmentSuggestionsDialog(QDialog):
 
         # Speichere Checkbox-Referenz im Widget für Click-Handler
         widget.checkbox = checkbox
-        widget.suggestion_index = index
+        widget.setProperty("suggestion_index", index)
 
-        # Mache das gesamte Widget klickbar
-        widget.mousePressEvent = lambda event: self.on_widget_clicked(widget, event)
+        # Mache das gesamte Widget klickbar (ein eventFilter für alle Karten)
+        widget.installEventFilter(self)
 
         return widget
 
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Leite Mausklicks auf Vorschlagskarten an on_widget_clicked weiter"""
+        if (
+            event.type() == QEvent.Type.MouseButtonPress
+            and obj.property("suggestion_index") is not None
+        ):
+            self.on_widget_clicked(obj, event)
+            return True
+
+        return super().eventFilter(obj, event)
+
     def on_widget_clicked(self, widget: QWidget, event):
         """Handler für Widget-Klicks - togglet die Checkbox oder wählt Bereich bei Shift"""
-        index = widget.suggestion_index
+        index = widget.property("suggestion_index")
 
         # Prüfe auf Shift-Klick für Bereichsauswahl
         if event.modifiers() & Qt.KeyboardModifier.ShiftModifier and self.last_clicked_index is not None:
@@ -298,12 +367,13 @@ class AssignmentSuggestionsDialog(QDialog):
         self.suggestions[index]["suggested_project_id"] = new_project_id
 
         # Finde das neue Projekt
-        new_project = next((p for p in self.projects if p["id"] == new_project_id), None)
+        new_project = self.project_by_id.get(new_project_id)
         if new_project:
             self.suggestions[index]["suggested_project_name"] = new_project["name"]
             self.suggestions[index]["suggested_project_color"] = new_project["color"]
 
-    def get_confidence_color(self, confidence: float) -> str:
+    @staticmethod
+    def get_confidence_color(confidence: float) -> str:
         """Bestimmt Farbe basierend auf Konfidenz"""
         if confidence >= 0.8:
             return "#27ae60"  # Grün
@@ -328,32 +398,31 @@ class AssignmentSuggestionsDialog(QDialog):
         if not widget:
             return
 
-        object_name = f"suggestion_card_{index}"
+        selected = index in self.selected_suggestions
+        if widget.property("selected") == selected:
+            return
 
-        if index in self.selected_suggestions:
-            # Ausgewählt: Grüne Umrandung (nur auf Haupt-Widget)
-            widget.setStyleSheet(
-                f"QWidget#{ object_name} {{ background-color: #f8f9fa; border: 3px solid #27ae60; "
-                f"border-radius: 5px; padding: 10px; margin: 2px; }} "
-                f"QWidget#{object_name}:hover {{ background-color: #e9ecef; border-color: #1e8449; }}"
-            )
-        else:
-            # Nicht ausgewählt: Standard-Style
-            widget.setStyleSheet(
-                f"QWidget#{object_name} {{ background-color: #f8f9fa; border: 1px solid #dee2e6; "
-                f"border-radius: 5px; padding: 10px; margin: 2px; }} "
-                f"QWidget#{object_name}:hover {{ background-color: #e9ecef; border-color: #adb5bd; }}"
-            )
+        # Ausgewählt: Grüne Umrandung. Nur neu polieren, kein CSS neu parsen
+        widget.setProperty("selected", selected)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
 
     def select_all(self):
         """Wähle alle Vorschläge aus"""
-        self.selected_suggestions = set(range(len(self.suggestions)))
+        all_suggestions = set(range(len(self.suggestions)))
+        if self.selected_suggestions == all_suggestions:
+            return
+
+        self.selected_suggestions = all_suggestions
         self.update_checkboxes()
         self.update_all_widget_styles()
         self.update_button_text()
 
     def select_none(self):
         """Wähle keine Vorschläge aus"""
+        if not self.selected_suggestions:
+            return
+
         self.selected_suggestions.clear()
         self.update_checkboxes()
         self.update_all_widget_styles()
@@ -361,17 +430,23 @@ class AssignmentSuggestionsDialog(QDialog):
 
     def update_all_widget_styles(self):
         """Aktualisiere alle Widget-Styles"""
-        for i in range(len(self.suggestions)):
-            self.update_widget_style(i)
+        # Ein Repaint für alle Karten statt eines pro Karte
+        # (setUpdatesEnabled(True) löst selbst ein update() aus)
+        self.suggestions_widget.setUpdatesEnabled(False)
+        try:
+            for i in self.widget_map:
+                self.update_widget_style(i)
+        finally:
+            self.suggestions_widget.setUpdatesEnabled(True)
 
     def update_checkboxes(self):
         """Aktualisiere Checkbox-States"""
-        for i in range(len(self.suggestions)):
-            checkbox = self.suggestions_widget.findChild(QCheckBox, f"checkbox_{i}")
-            if checkbox:
-                checkbox.blockSignals(True)
-                checkbox.setChecked(i in self.selected_suggestions)
-                checkbox.blockSignals(False)
+        # Checkbox-Referenz direkt am Widget statt rekursiver findChild-Suche
+        for i, widget in self.widget_map.items():
+            checkbox = widget.checkbox
+            checkbox.blockSignals(True)
+            checkbox.setChecked(i in self.selected_suggestions)
+            checkbox.blockSignals(False)
 
     def update_button_text(self):
         """Aktualisiere Button-Text mit Anzahl"""
@@ -383,13 +458,11 @@ class AssignmentSuggestionsDialog(QDialog):
         if not self.selected_suggestions:
             return
 
-        # Wende Zuordnungen an
-        for index in self.selected_suggestions:
-            suggestion = self.suggestions[index]
-            activity_id = suggestion["activity"]["id"]
-            project_id = suggestion["suggested_project_id"]
-
-            self.database.assign_activity_to_project(activity_id, project_id)
+        # Wende alle Zuordnungen in einer Transaktion an
+        self.database.assign_activities_to_projects([
+            (self.suggestions[index]["suggested_project_id"], self.suggestions[index]["activity"]["id"])
+            for index in self.selected_suggestions
+        ])
 
         print(f"✓ {len(self.selected_suggestions)} Aktivitäten zugeordnet")
 
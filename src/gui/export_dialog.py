@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import Optional
 
-from PyQt6.QtCore import QDate
+from PyQt6.QtCore import QDate, QObject, QRunnable, Qt, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
+    QApplication,
     QComboBox,
     QDateEdit,
     QDialog,
@@ -18,13 +19,63 @@ from core.database_protocol import DatabaseProtocol
 from utils.export import Exporter
 
 
+class ExportSignals(QObject):
+    """Signals of an ExportJob (QRunnable itself cannot emit signals)"""
+
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+
+class ExportJob(QRunnable):
+    """Runs one export function in the thread pool, off the GUI thread"""
+
+    def __init__(self, export_func, start_date: datetime, end_date: datetime, filepath: str):
+        super().__init__()
+        self.export_func = export_func
+        self.start_date = start_date
+        self.end_date = end_date
+        self.filepath = filepath
+        self.signals = ExportSignals()
+
+    def run(self):
+        """Run the export and report the exported count or the error"""
+        try:
+            count = self.export_func(self.start_date, self.end_date, self.filepath)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(count)
+
+
 class ExportDialog(QDialog):
     """Dialog for exporting data"""
 
+    # Per export type (same order as the combo box): default file name
+    # prefix and suffix, file filter, save dialog title, Exporter method and
+    # success message
+    EXPORT_TYPES = (
+        (
+            "aktivitaeten", ".csv", "CSV Dateien (*.csv)", "CSV Datei speichern",
+            "export_csv",
+            "{count} Aktivitäten wurden exportiert nach:\n{filepath}",
+        ),
+        (
+            "projekt_zusammenfassung", ".csv", "CSV Dateien (*.csv)", "CSV Datei speichern",
+            "export_project_summary_csv",
+            "{count} Projekte wurden exportiert nach:\n{filepath}",
+        ),
+        (
+            "timetracker_export", ".xlsx", "Excel Dateien (*.xlsx)", "Excel Datei speichern",
+            "export_excel",
+            "{count} Aktivitäten wurden in Excel-Format exportiert nach:\n{filepath}\n\nDas Excel enthält 3 Sheets:\n- Detailliert\n- Projekt-Zusammenfassung\n- Tages-Zusammenfassung",
+        ),
+    )
+
     def __init__(self, database: DatabaseProtocol, parent: Optional[QDialog] = None):
         super().__init__(parent)
         self.database = database
         self.exporter = Exporter(database)
+        self._export_job: Optional[ExportJob] = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -86,14 +137,14 @@ class ExportDialog(QDialog):
         layout.addStretch()
 
         # Export button
-        export_btn = QPushButton("Exportieren")
-        export_btn.clicked.connect(self.export_data)
-        layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Exportieren")
+        self.export_btn.clicked.connect(self.export_data)
+        layout.addWidget(self.export_btn)
 
         # Cancel button
-        cancel_btn = QPushButton("Abbrechen")
-        cancel_btn.clicked.connect(self.reject)
-        layout.addWidget(cancel_btn)
+        self.cancel_btn = QPushButton("Abbrechen")
+        self.cancel_btn.clicked.connect(self.reject)
+        layout.addWidget(self.cancel_btn)
 
     def set_today(self):
         """Set date range to today"""
@@ -116,31 +167,25 @@ class ExportDialog(QDialog):
         self.start_date_edit.setDate(first_day)
         self.end_date_edit.setDate(today)
 
+    @staticmethod
+    def _qdate_to_datetime_range(qd_start: QDate, qd_end: QDate) -> tuple[datetime, datetime]:
+        """Convert a QDate range to datetimes from start of the first to end of the last day"""
+        return (
+            datetime.combine(qd_start.toPyDate(), datetime.min.time()),
+            datetime.combine(qd_end.toPyDate(), datetime.max.time()),
+        )
+
     def export_data(self):
         """Export data based on selection"""
-        start_date = self.start_date_edit.date().toPyDate()
-        end_date = self.end_date_edit.date().toPyDate()
-
-        # Convert to datetime
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        end_datetime = datetime.combine(end_date, datetime.max.time())
+        start_datetime, end_datetime = self._qdate_to_datetime_range(
+            self.start_date_edit.date(), self.end_date_edit.date()
+        )
+        prefix, suffix, file_filter, dialog_title, method, message = (
+            self.EXPORT_TYPES[self.export_type.currentIndex()]
+        )
 
         # Get filename from user
-        export_type_idx = self.export_type.currentIndex()
-
-        if export_type_idx == 0:
-            default_name = f"aktivitaeten_{start_date}_{end_date}.csv"
-            file_filter = "CSV Dateien (*.csv)"
-            dialog_title = "CSV Datei speichern"
-        elif export_type_idx == 1:
-            default_name = f"projekt_zusammenfassung_{start_date}_{end_date}.csv"
-            file_filter = "CSV Dateien (*.csv)"
-            dialog_title = "CSV Datei speichern"
-        else:
-            default_name = f"timetracker_export_{start_date}_{end_date}.xlsx"
-            file_filter = "Excel Dateien (*.xlsx)"
-            dialog_title = "Excel Datei speichern"
-
+        default_name = f"{prefix}_{start_datetime.date()}_{end_datetime.date()}{suffix}"
         filepath, _ = QFileDialog.getSaveFileName(
             self,
             dialog_title,
@@ -151,34 +196,54 @@ class ExportDialog(QDialog):
         if not filepath:
             return
 
-        try:
-            if export_type_idx == 0:
-                count = self.exporter.export_csv(start_datetime, end_datetime, filepath)
-                QMessageBox.information(
-                    self,
-                    "Export erfolgreich",
-                    f"{count} Aktivitäten wurden exportiert nach:\n{filepath}"
-                )
-            elif export_type_idx == 1:
-                count = self.exporter.export_project_summary_csv(start_datetime, end_datetime, filepath)
-                QMessageBox.information(
-                    self,
-                    "Export erfolgreich",
-                    f"{count} Projekte wurden exportiert nach:\n{filepath}"
-                )
-            else:
-                count = self.exporter.export_excel(start_datetime, end_datetime, filepath)
-                QMessageBox.information(
-                    self,
-                    "Export erfolgreich",
-                    f"{count} Aktivitäten wurden in Excel-Format exportiert nach:\n{filepath}\n\nDas Excel enthält 3 Sheets:\n- Detailliert\n- Projekt-Zusammenfassung\n- Tages-Zusammenfassung"
-                )
-
-            self.accept()
+        export_func = getattr(self.exporter, method)
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export fehlgeschlagen",
-                f"Fehler beim Exportieren: {e}"
-            )
+        # Export in the thread pool so the GUI stays responsive
+        job = ExportJob(export_func, start_datetime, end_datetime, filepath)
+        job.signals.finished.connect(
+            lambda count: self.on_export_finished(message.format(count=count, filepath=filepath))
+        )
+        job.signals.failed.connect(self.on_export_failed)
+        self._export_job = job
+
+        # A running export cannot be stopped, so the dialog stays open until
+        # it finished or failed
+        self.export_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        QThreadPool.globalInstance().start(job)
+
+    def on_export_finished(self, message: str):
+        """Show the result of a successful export and close the dialog"""
+        self._end_export()
+        QMessageBox.information(self, "Export erfolgreich", message)
+        self.accept()
+
+    def on_export_failed(self, error: str):
+        """Show the error of a failed export"""
+        self._end_export()
+        QMessageBox.critical(
+            self,
+            "Export fehlgeschlagen",
+            f"Fehler beim Exportieren: {error}"
+        )
+
+    def _end_export(self):
+        """Restore the dialog after an export finished or failed"""
+        QApplication.restoreOverrideCursor()
+        self.export_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+        self._export_job = None
+
+    def reject(self):
+        """Close the dialog unless an export is still running (also Escape)"""
+        if self._export_job is not None:
+            return
+        super().reject()
+
+    def closeEvent(self, event):
+        """Keep the dialog open while an export is running"""
+        if self._export_job is not None:
+            event.ignore()
+            return
+        super().closeEvent(event)
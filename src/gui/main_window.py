@@ -1,7 +1,20 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 import json
-
-from PyQt6.QtCore import QDate, QEvent, Qt, QTimer
+import re
+from typing import Optional
+
+from PyQt6.QtCore import (
+    QDate,
+    QEvent,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QFont, QFontMetrics
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -27,6 +40,176 @@ from .settings_dialog import SettingsDialog
 from .timeline import TimelineWidget
 
 
+# Window title patterns for _extract_filename_from_title, compiled once. Each
+# one is only run when the title contains text it cannot match without (a
+# keyword, "[" or "."), which is far cheaper than a failing regex.
+_AUTODESK_RE = re.compile(r"\[([^\]]+\.[a-zA-Z0-9]+)\]")
+_CYCLONE_RE = re.compile(r"^(.+?)\s*-\s*Cyclone 3DR")
+_REVIT_RE = re.compile(r"^(.+?)\s*-\s*(Autodesk\s+)?Revit")
+_BLENDER_RE = re.compile(r"(.+?\.blend)")
+_TEAMS_RE = re.compile(r"Chat\s*\|\s*([^|]+?)\s*\|")
+_SLACK_RE = re.compile(r"^(#[^\|]+)\s*\|")
+_ZOOM_RE = re.compile(r"^Zoom Meeting\s*-\s*(.+)")
+_JETBRAINS_RE = re.compile(r"^([^\-]+\.[a-zA-Z0-9]+)\s*-\s*([^\[]+)")
+_JETBRAINS_IDES = ("PyCharm", "IntelliJ", "WebStorm", "PhpStorm")
+_VSCODE_RE = re.compile(r"^(.+?)\s*-\s*([^-]+)\s*-\s*Visual Studio Code")
+_OFFICE_RE = re.compile(
+    r"^(.+?\.(docx?|xlsx?|pptx?|pdf))\s*-\s*(Microsoft\s+)?(Word|Excel|PowerPoint|Outlook)",
+    re.IGNORECASE,
+)
+_ADOBE_RE = re.compile(r"^(.+?\.pdf)\s*-\s*Adobe", re.IGNORECASE)
+_NOTEPAD_RE = re.compile(r"^(.+?\.[a-zA-Z0-9]+)\s*-\s*Notepad\+\+")
+_BROWSERS = (
+    "Google Chrome", "Mozilla Firefox", "Microsoft Edge", "Opera", "Safari", "Brave"
+)
+_BROWSER_RE = re.compile(rf"^(.+?)\s*-\s*({'|'.join(_BROWSERS)})$")
+_OUTLOOK_SUFFIX_RE = re.compile(r"\s*-\s*(Microsoft\s+)?Outlook.*$")
+_FIGMA_RE = re.compile(r"^(.+?)\s*-\s*Figma$")
+_FILE_RE = re.compile(r'([^\\/:\*\?"<>\|]+\.[a-zA-Z0-9]+)')
+_FILE_APP_SUFFIX_RE = re.compile(
+    r"\s*-\s*(Visual Studio Code|Notepad|Word|Excel|PowerPoint|Adobe|Reader).*$"
+)
+_APP_SUFFIX_RE = re.compile(
+    r"\s*-\s*(Microsoft Teams|Google Chrome|Firefox|Edge|Outlook|Discord|Spotify)$"
+)
+
+
+@lru_cache(maxsize=1024)
+def _extract_filename_from_title(window_title):
+    """Extract filename or relevant content from window title
+
+    Titles repeat throughout a day, so results are cached per title.
+    """
+    if not window_title:
+        return None
+
+    # Pattern 1: Autodesk/CAD style - "Program - [filename.ext]" or "Program [filename.ext]"
+    if "[" in window_title:
+        autodesk_match = _AUTODESK_RE.search(window_title)
+        if autodesk_match:
+            return autodesk_match.group(1)
+
+    # Pattern 1b: Cyclone 3DR - "project_name - Cyclone 3DR version"
+    if "Cyclone 3DR" in window_title:
+        cyclone_match = _CYCLONE_RE.match(window_title)
+        if cyclone_match:
+            return cyclone_match.group(1).strip()
+
+    # Pattern 1c: Revit - "project_name - Autodesk Revit" or similar
+    if "Revit" in window_title:
+        revit_match = _REVIT_RE.match(window_title)
+        if revit_match:
+            return revit_match.group(1).strip()
+
+    # Pattern 1d: Blender - "filename.blend - Blender" or "Blender - filename.blend"
+    if "Blender" in window_title:
+        blender_match = _BLENDER_RE.search(window_title)
+        if blender_match:
+            return blender_match.group(1).strip()
+
+    # Pattern 2: Teams chat - "Chat | Person Name | ..."
+    if "Chat" in window_title:
+        teams_match = _TEAMS_RE.search(window_title)
+        if teams_match:
+            return teams_match.group(1).strip()
+
+    # Pattern 3: Slack - "#channel-name | Workspace - Slack"
+    if window_title.startswith("#"):
+        slack_match = _SLACK_RE.search(window_title)
+        if slack_match:
+            return slack_match.group(1).strip()
+
+    # Pattern 4: Zoom - "Zoom Meeting - Meeting Name" or "Zoom Meeting"
+    if window_title.startswith("Zoom Meeting"):
+        zoom_match = _ZOOM_RE.match(window_title)
+        if zoom_match:
+            return zoom_match.group(1).strip()
+
+    # Pattern 5: JetBrains IDEs - "filename.ext - Project [Path] - IDE"
+    if any(ide in window_title for ide in _JETBRAINS_IDES):
+        jetbrains_match = _JETBRAINS_RE.match(window_title)
+        if jetbrains_match:
+            filename = jetbrains_match.group(1).strip()
+            project = jetbrains_match.group(2).strip()
+            return f"{filename} - {project}"
+
+    # Pattern 6: VS Code style - "content... - Project - Visual Studio Code"
+    if "Visual Studio Code" in window_title:
+        vscode_match = _VSCODE_RE.match(window_title)
+        if vscode_match:
+            content = vscode_match.group(1).strip()
+            project = vscode_match.group(2).strip()
+            return f"{content} - {project}"
+
+    # Patterns 7-9 and 13 need a file extension
+    has_dot = "." in window_title
+
+    # Pattern 7: Microsoft Office - "filename.ext - Word/Excel/PowerPoint"
+    if has_dot:
+        office_match = _OFFICE_RE.match(window_title)
+        if office_match:
+            return office_match.group(1)
+
+    # Pattern 8: Adobe Reader/Acrobat - "filename.pdf - Adobe..."
+    if has_dot:
+        adobe_match = _ADOBE_RE.match(window_title)
+        if adobe_match:
+            return adobe_match.group(1)
+
+    # Pattern 9: Notepad++ - "filename.ext - Notepad++"
+    if has_dot and "Notepad++" in window_title:
+        notepad_match = _NOTEPAD_RE.match(window_title)
+        if notepad_match:
+            return notepad_match.group(1)
+
+    # Pattern 10: Browsers - "Page Title - Browser Name"
+    # ("$" also matches before a trailing newline)
+    if window_title.rstrip("\n").endswith(_BROWSERS):
+        browser_match = _BROWSER_RE.match(window_title)
+        if browser_match:
+            page_title = browser_match.group(1).strip()
+            # Limit very long page titles
+            return page_title[:80] if len(page_title) > 80 else page_title
+
+    # Pattern 11: Outlook - various formats
+    if "Outlook" in window_title:
+        # Remove " - Outlook" suffix
+        outlook_cleaned = _OUTLOOK_SUFFIX_RE.sub("", window_title)
+        if outlook_cleaned:
+            # For inbox view, take first part
+            parts = outlook_cleaned.split(" - ")
+            return parts[0].strip()[:60]
+
+    # Pattern 12: Figma - "Design Name - Figma"
+    if "Figma" in window_title:
+        figma_match = _FIGMA_RE.match(window_title)
+        if figma_match:
+            return figma_match.group(1).strip()
+
+    # Pattern 13: General file with extension
+    if has_dot:
+        file_match = _FILE_RE.search(window_title)
+        if file_match:
+            filename = file_match.group(1)
+            # Remove common application suffixes
+            filename = _FILE_APP_SUFFIX_RE.sub("", filename)
+            return filename.strip()
+
+    # Pattern 14: For other apps, extract first meaningful part
+    # Remove common app names at the end
+    cleaned = _APP_SUFFIX_RE.sub("", window_title)
+
+    # If we removed something and there's still content, return it
+    if cleaned != window_title and cleaned.strip():
+        # Limit length and take first part if multiple separators
+        parts = cleaned.split(" - ")
+        if len(parts) > 0:
+            result = parts[0].strip()
+            return result[:60] if len(result) > 60 else result
+
+    return None
+
+
 class ProjectDropWidget(QWidget):
     """Widget that accepts drops for project assignment"""
 
@@ -62,22 +245,16 @@ class ProjectDropWidget(QWidget):
                 activity_data = json.loads(event.mimeData().text())
                 print(f"DEBUG: Received {len(activity_data)} activities to drop")
 
-                # Assign all activities to this project
-                total_count = 0
+                # Use timerange assignment for merged activities, all in one transaction
+                timeranges = []
                 for act_data in activity_data:
                     timestamp = datetime.fromisoformat(act_data['timestamp'])
-                    duration = act_data['duration']
-                    app_name = act_data['app_name']
-
-                    print(f"DEBUG: Processing activity - App: {app_name}, Start: {timestamp}, Duration: {duration}s")
+                    end_time = timestamp + timedelta(seconds=act_data['duration'])
+                    timeranges.append((timestamp, end_time, act_data['app_name']))
 
-                    # Use timerange assignment for merged activities
-                    end_time = timestamp + timedelta(seconds=duration)
-                    count = self.main_window.database.assign_activities_by_timerange(
-                        timestamp, end_time, app_name, self.project_id
-                    )
-                    print(f"DEBUG: Assigned {count} activities for this timerange")
-                    total_count += count
+                total_count = self.main_window.database.assign_activities_bulk(
+                    timeranges, self.project_id
+                )
 
                 print(f"Assigned {total_count} activities to project '{self.project_name}'")
 
@@ -91,9 +268,116 @@ class ProjectDropWidget(QWidget):
                 traceback.print_exc()
 
 
+@dataclass
+class DayStats:
+    """Per-day totals shown in the stats bar and the sidebar (in seconds)"""
+
+    active_seconds: int = 0
+    idle_seconds: int = 0
+    project_times: dict = field(default_factory=dict)
+    unassigned_seconds: int = 0
+    app_times: dict = field(default_factory=dict)
+    app_paths: dict = field(default_factory=dict)  # app -> process_path, for the icon
+    file_times: dict = field(default_factory=dict)
+    file_app_paths: dict = field(default_factory=dict)  # file -> process_path
+
+    @classmethod
+    def from_activities(cls, activities):
+        """Group the day by project, app and file in a single pass"""
+        stats = cls()
+        project_times = stats.project_times
+        app_times = stats.app_times
+        app_paths = stats.app_paths
+        file_times = stats.file_times
+        file_app_paths = stats.file_app_paths
+
+        for activity in activities:
+            app_name = activity["app_name"]
+            process_path = activity.get("process_path")
+            if process_path and app_name not in app_paths:
+                app_paths[app_name] = process_path
+
+            duration = activity["duration"]
+            if activity.get("is_idle", False):
+                stats.idle_seconds += duration
+                continue
+
+            stats.active_seconds += duration
+
+            project_id = activity.get("project_id")
+            if project_id:
+                project_times[project_id] = project_times.get(project_id, 0) + duration
+            else:
+                stats.unassigned_seconds += duration
+
+            app_times[app_name] = app_times.get(app_name, 0) + duration
+
+            window_title = activity.get("window_title", "")
+            if not window_title:
+                continue
+
+            # Try to extract filename from window title
+            filename = _extract_filename_from_title(window_title)
+            if filename and filename != "Keine Datei erkannt":
+                if filename not in file_times:
+                    file_times[filename] = 0
+                    if process_path:
+                        file_app_paths[filename] = process_path
+                file_times[filename] += duration
+
+        return stats
+
+
+class TimelineLoadSignals(QObject):
+    """Signals of a TimelineLoadJob (QRunnable itself cannot emit signals)"""
+
+    loaded = pyqtSignal(object, list, object)
+    failed = pyqtSignal(str)
+
+
+class TimelineLoadJob(QRunnable):
+    """Loads and summarizes one day's activities in the thread pool"""
+
+    def __init__(self, database: DatabaseProtocol, day):
+        super().__init__()
+        self.database = database
+        self.day = day
+        self.signals = TimelineLoadSignals()
+
+    def run(self):
+        """Query the day and report its activities and DayStats or the error"""
+        try:
+            activities = self.database.get_activities_for_day(self.day)
+            stats = DayStats.from_activities(activities)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.loaded.emit(self.day, activities, stats)
+
+
+class StatRow:
+    """One reusable row of the statistics sidebar
+
+    ``key`` is the app name or filename the row currently shows and is read
+    by the click handlers; ``color`` is the project color last applied.
+    """
+
+    def __init__(self, widget, name_label, time_label, color_label=None, icon_label=None):
+        self.widget = widget
+        self.name_label = name_label
+        self.time_label = time_label
+        self.color_label = color_label
+        self.icon_label = icon_label
+        self.key = None
+        self.color = None
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
 
+    # Emitted (from any thread) when the tracker saved new activities
+    activities_saved = pyqtSignal()
+
     def __init__(self, database: DatabaseProtocol, tracker: ActivityTracker):
         super().__init__()
         self.database = database
@@ -103,14 +387,61 @@ class MainWindow(QMainWindow):
         # Icon cache
         self.icon_cache = IconCache()
 
+        # Set when the day's data changed since the last load_timeline
+        self._dirty = False
+
+        # All activities of current_date as last loaded and their totals, the
+        # running load job and whether another load was requested while it ran
+        self._day_activities: list = []
+        self._day_stats = DayStats()
+        self._load_job: Optional[TimelineLoadJob] = None
+        self._reload_pending = False
+
+        self.init_fonts()
         self.setup_ui()
         self.load_timeline()
 
-        # Auto-refresh timeline every 30 seconds
+        # Refresh when the tracker wrote activities. The signal is emitted from
+        # the tracker thread and delivered queued; bursts within 250 ms are
+        # coalesced into one refresh.
+        self._refresh_debounce = QTimer()
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setInterval(250)
+        self._refresh_debounce.timeout.connect(self.refresh_if_dirty)
+        self.activities_saved.connect(self.schedule_refresh)
+        self.tracker.on_activities_saved = self.activities_saved.emit
+
+        # Fallback: check every 30 seconds whether a refresh is still due
         self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_timeline)
+        self.refresh_timer.timeout.connect(self.refresh_if_dirty)
         self.refresh_timer.start(30000)
 
+    def init_fonts(self):
+        """Create the label fonts once; all labels of a kind share them"""
+        self._font_title = self._make_font(14, bold=True)
+        self._font_header = self._make_font(12, bold=True)
+        self._font_bar_title = self._make_font(10, bold=True)
+        self._font_name = self._make_font(11, bold=True)
+        self._font_text = self._make_font(11)
+        self._font_italic = self._make_font(11, italic=True)
+        self._font_hint = self._make_font(9, italic=True)
+
+        # Project buttons in the recent projects bar keep the default size
+        self._font_bar_project = self._make_font(bold=True)
+        self._font_bar_project_metrics = QFontMetrics(self._font_bar_project)
+
+    @staticmethod
+    def _make_font(point_size=None, bold=False, italic=False):
+        """Return a QFont with the given size and style"""
+        font = QFont()
+        if point_size is not None:
+            font.setPointSize(point_size)
+        if bold:
+            font.setBold(True)
+        if italic:
+            font.setItalic(True)
+        return font
+
     def setup_ui(self):
         """Setup the user interface"""
         self.setWindowTitle("TimeTracker")
@@ -256,18 +587,12 @@ class MainWindow(QMainWindow):
 
         # Title with description
         title_label = QLabel("Zuletzt verwendet:")
-        title_font = QFont()
-        title_font.setPointSize(10)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(self._font_bar_title)
         layout.addWidget(title_label)
 
         # Description
         desc_label = QLabel("(Aktivitäten per Drag & Drop hier zuordnen)")
-        desc_font = QFont()
-        desc_font.setPointSize(9)
-        desc_font.setItalic(True)
-        desc_label.setFont(desc_font)
+        desc_label.setFont(self._font_hint)
         desc_label.setStyleSheet("color: #7f8c8d;")
         layout.addWidget(desc_label)
 
@@ -311,11 +636,10 @@ class MainWindow(QMainWindow):
             project_label.setWordWrap(False)
 
             # Elide text if too long
-            label_font = project_label.font()
-            label_font.setBold(True)
-            project_label.setFont(label_font)
-            fm = QFontMetrics(label_font)
-            elided_name = fm.elidedText(project['name'], Qt.TextElideMode.ElideRight, 130)
+            project_label.setFont(self._font_bar_project)
+            elided_name = self._font_bar_project_metrics.elidedText(
+                project['name'], Qt.TextElideMode.ElideRight, 130
+            )
             project_label.setText(elided_name)
             project_label.setToolTip(project['name'])
 
@@ -369,10 +693,7 @@ class MainWindow(QMainWindow):
 
         # Title
         title = QLabel("Tagesstatistik")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._font_title)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
@@ -390,74 +711,220 @@ class MainWindow(QMainWindow):
         stats_widget = QWidget()
         self.stats_layout = QVBoxLayout(stats_widget)
         self.stats_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.build_stats_content()
 
         stats_scroll.setWidget(stats_widget)
         layout.addWidget(stats_scroll)
 
         return sidebar
 
-    def update_stats_sidebar(self, activities):
-        """Update the statistics sidebar with project and app time"""
-        # Clear existing widgets
-        while self.stats_layout.count():
-            child = self.stats_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+    def build_stats_content(self):
+        """Create the fixed parts of the statistics sidebar
 
-        if not activities:
-            no_data = QLabel("Keine Daten für diesen Tag")
-            no_data.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data.setStyleSheet("color: #7f8c8d; padding: 20px;")
-            self.stats_layout.addWidget(no_data)
-            return
+        Rows for projects, apps and files are pooled: update_stats_sidebar
+        reuses them and only creates new ones when a day needs more.
+        """
+        self.no_data_label = QLabel("Keine Daten für diesen Tag")
+        self.no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_data_label.setStyleSheet("color: #7f8c8d; padding: 20px;")
+        self.stats_layout.addWidget(self.no_data_label)
 
-        # Get ALL activities for the day (not just filtered ones)
-        start_datetime = datetime.combine(self.current_date, datetime.min.time())
-        end_datetime = datetime.combine(self.current_date, datetime.max.time())
-        all_activities = self.database.get_activities(
-            start_date=start_datetime, end_date=end_datetime
-        )
-
-        # Calculate total time from all activities
-        total_seconds = sum(
-            a["duration"] for a in all_activities if not a.get("is_idle", False)
-        )
+        self.stats_content = QWidget()
+        content_layout = QVBoxLayout(self.stats_content)
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        self.stats_layout.addWidget(self.stats_content)
 
         # --- Project Statistics ---
         project_header = QLabel("Zeit pro Projekt")
-        project_header_font = QFont()
-        project_header_font.setPointSize(12)
-        project_header_font.setBold(True)
-        project_header.setFont(project_header_font)
+        project_header.setFont(self._font_header)
         project_header.setStyleSheet("margin-top: 10px; margin-bottom: 5px;")
-        self.stats_layout.addWidget(project_header)
+        content_layout.addWidget(project_header)
 
         # Project description
         project_desc = QLabel("Drag & Drop zum Zuordnen")
-        project_desc_font = QFont()
-        project_desc_font.setPointSize(9)
-        project_desc_font.setItalic(True)
-        project_desc.setFont(project_desc_font)
+        project_desc.setFont(self._font_hint)
         project_desc.setStyleSheet("color: #7f8c8d; margin-bottom: 5px;")
-        self.stats_layout.addWidget(project_desc)
+        content_layout.addWidget(project_desc)
 
-        # Group by project (use all activities, not filtered)
-        project_times = {}
-        unassigned_time = 0
+        self.project_rows = []
+        self.project_rows_layout = self._add_rows_container(content_layout)
 
-        for activity in all_activities:
-            if activity.get("is_idle", False):
-                continue
+        # Unassigned time
+        self.unassigned_widget = QWidget()
+        unassigned_layout = QHBoxLayout(self.unassigned_widget)
+        unassigned_layout.setContentsMargins(5, 5, 5, 5)
 
-            duration = activity["duration"]
-            project_id = activity.get("project_id")
+        color_label = QLabel()
+        color_label.setFixedSize(18, 18)
+        color_label.setStyleSheet("background-color: #95a5a6; border-radius: 2px;")
+        unassigned_layout.addWidget(color_label)
 
-            if project_id:
-                if project_id not in project_times:
-                    project_times[project_id] = 0
-                project_times[project_id] += duration
-            else:
-                unassigned_time += duration
+        name_label = QLabel("Ohne Projekt")
+        name_label.setFont(self._font_italic)
+        name_label.setStyleSheet("color: #7f8c8d;")
+        unassigned_layout.addWidget(name_label, stretch=1)
+
+        self.unassigned_time_label = QLabel()
+        self.unassigned_time_label.setFont(self._font_text)
+        self.unassigned_time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        unassigned_layout.addWidget(self.unassigned_time_label)
+
+        content_layout.addWidget(self.unassigned_widget)
+
+        # --- App Statistics ---
+        app_header = QLabel("Zeit pro App")
+        app_header.setFont(self._font_header)
+        app_header.setStyleSheet("margin-top: 15px; margin-bottom: 5px;")
+        content_layout.addWidget(app_header)
+
+        self.app_rows = []
+        self.app_rows_layout = self._add_rows_container(content_layout)
+        self.more_apps_label = self._add_note_label(content_layout)
+
+        # --- File Statistics ---
+        file_header = QLabel("Zeit pro Datei")
+        file_header.setFont(self._font_header)
+        file_header.setStyleSheet("margin-top: 15px; margin-bottom: 5px;")
+        content_layout.addWidget(file_header)
+
+        self.file_rows = []
+        self.file_rows_layout = self._add_rows_container(content_layout)
+        self.more_files_label = self._add_note_label(content_layout)
+        self.no_files_label = self._add_note_label(content_layout)
+        self.no_files_label.setText("Keine Dateien erkannt")
+
+    def _add_rows_container(self, parent_layout):
+        """Add a widget holding one section's pooled rows, return its layout"""
+        container = QWidget()
+        rows_layout = QVBoxLayout(container)
+        rows_layout.setContentsMargins(0, 0, 0, 0)
+        parent_layout.addWidget(container)
+        return rows_layout
+
+    def _add_note_label(self, parent_layout):
+        """Add a grey italic hint label (e.g. "... und X weitere Apps")"""
+        label = QLabel()
+        label.setStyleSheet("color: #7f8c8d; font-style: italic; padding: 5px;")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        parent_layout.addWidget(label)
+        return label
+
+    def _create_project_row(self):
+        """Create a pooled project row (with drop support)"""
+        project_widget = ProjectDropWidget(None, "", self)
+        project_layout = QHBoxLayout(project_widget)
+        project_layout.setContentsMargins(5, 5, 5, 5)
+
+        # Color indicator
+        color_label = QLabel()
+        color_label.setFixedSize(18, 18)
+        color_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        project_layout.addWidget(color_label)
+
+        # Project name (full text, scrollable)
+        name_label = QLabel()
+        name_label.setFont(self._font_name)
+        name_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        name_label.setWordWrap(False)
+        name_label.setTextFormat(Qt.TextFormat.PlainText)
+        # Allow full width, scrolling will handle overflow
+        project_layout.addWidget(name_label, stretch=1)
+
+        # Time (ensure it's always visible)
+        time_label = QLabel()
+        time_label.setFont(self._font_text)
+        time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        time_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        time_label.setMinimumWidth(120)
+        project_layout.addWidget(time_label)
+
+        self.project_rows_layout.addWidget(project_widget)
+        return StatRow(
+            project_widget,
+            name_label,
+            time_label,
+            color_label=color_label,
+        )
+
+    def _create_item_row(self, rows_layout, on_click):
+        """Create a pooled app/file row; clicking the name calls on_click(key)"""
+        item_widget = QWidget()
+        item_layout = QHBoxLayout(item_widget)
+        item_layout.setContentsMargins(5, 5, 5, 5)
+
+        # App icon, hidden when there is none
+        icon_label = QLabel()
+        icon_label.setFixedSize(24, 24)
+        item_layout.addWidget(icon_label)
+
+        # Name (clickable)
+        name_label = QLabel()
+        name_label.setFont(self._font_text)
+        name_label.setCursor(Qt.CursorShape.PointingHandCursor)
+        item_layout.addWidget(name_label, stretch=1)
+
+        # Time
+        time_label = QLabel()
+        time_label.setFont(self._font_text)
+        time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        item_layout.addWidget(time_label)
+
+        rows_layout.addWidget(item_widget)
+        row = StatRow(item_widget, name_label, time_label, icon_label=icon_label)
+        name_label.mousePressEvent = lambda event: on_click(row.key)
+        return row
+
+    @staticmethod
+    def _pooled_row(rows, index, create_row):
+        """Return row ``index`` of a pool, creating it on first use"""
+        if index == len(rows):
+            rows.append(create_row())
+        row = rows[index]
+        row.widget.setVisible(True)
+        return row
+
+    @staticmethod
+    def _hide_unused_rows(rows, used):
+        """Hide the pooled rows beyond the first ``used`` ones"""
+        for row in rows[used:]:
+            row.widget.setVisible(False)
+
+    def _set_row_icon(self, row, process_path):
+        """Show the app icon of process_path in an app/file row"""
+        scaled_icon = None
+        if process_path:
+            # Scaled to exact size once per path, then served from the cache
+            scaled_icon = self.icon_cache.get_scaled_icon_pixmap(
+                process_path, size=32, display_size=24
+            )
+
+        if scaled_icon is None:
+            row.icon_label.setVisible(False)
+        else:
+            row.icon_label.setPixmap(scaled_icon)
+            row.icon_label.setVisible(True)
+
+    def update_stats_sidebar(self, activities, stats):
+        """Update the statistics sidebar with project and app time
+
+        ``activities`` is the filtered timeline view, ``stats`` the DayStats
+        of the whole day the totals come from.
+        """
+        if not activities:
+            self.stats_content.setVisible(False)
+            self.no_data_label.setVisible(True)
+            return
+
+        self.no_data_label.setVisible(False)
+        self.stats_content.setVisible(True)
+
+        total_seconds = stats.active_seconds
+        project_times = stats.project_times
+        unassigned_time = stats.unassigned_seconds
+        app_times = stats.app_times
+        app_paths = stats.app_paths
+        file_times = stats.file_times
+        file_app_paths = stats.file_app_paths
 
         # Get project names and colors
         projects = self.database.get_projects()
@@ -469,6 +936,7 @@ class MainWindow(QMainWindow):
         )
 
         # Display projects
+        shown_projects = 0
         for project_id, seconds in sorted_projects:
             project = project_map.get(project_id)
             if not project:
@@ -477,43 +945,21 @@ class MainWindow(QMainWindow):
             hours = seconds / 3600
             percentage = (seconds / total_seconds * 100) if total_seconds > 0 else 0
 
-            # Project item (with drop support)
-            project_widget = ProjectDropWidget(project_id, project["name"], self)
-            project_layout = QHBoxLayout(project_widget)
-            project_layout.setContentsMargins(5, 5, 5, 5)
-
-            # Color indicator
-            color_label = QLabel()
-            color_label.setFixedSize(18, 18)
-            color_label.setStyleSheet(
-                f"background-color: {project['color']}; border-radius: 2px;"
+            row = self._pooled_row(
+                self.project_rows, shown_projects, self._create_project_row
             )
-            color_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-            project_layout.addWidget(color_label)
-
-            # Project name (full text, scrollable)
-            name_label = QLabel(project["name"])
-            name_font = QFont()
-            name_font.setPointSize(11)
-            name_font.setBold(True)
-            name_label.setFont(name_font)
-            name_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-            name_label.setWordWrap(False)
-            name_label.setTextFormat(Qt.TextFormat.PlainText)
-            # Allow full width, scrolling will handle overflow
-            project_layout.addWidget(name_label, stretch=1)
-
-            # Time (ensure it's always visible)
-            time_label = QLabel(f"{hours:.1f}h ({percentage:.0f}%)")
-            time_font = QFont()
-            time_font.setPointSize(11)
-            time_label.setFont(time_font)
-            time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            time_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-            time_label.setMinimumWidth(120)
-            project_layout.addWidget(time_label)
-
-            self.stats_layout.addWidget(project_widget)
+            row.widget.project_id = project_id
+            row.widget.project_name = project["name"]
+            if row.color != project["color"]:
+                row.color = project["color"]
+                row.color_label.setStyleSheet(
+                    f"background-color: {project['color']}; border-radius: 2px;"
+                )
+            row.name_label.setText(project["name"])
+            row.time_label.setText(f"{hours:.1f}h ({percentage:.0f}%)")
+            shown_projects += 1
+
+        self._hide_unused_rows(self.project_rows, shown_projects)
 
         # Unassigned time
         if unassigned_time > 0:
@@ -521,368 +967,80 @@ class MainWindow(QMainWindow):
             percentage = (
                 (unassigned_time / total_seconds * 100) if total_seconds > 0 else 0
             )
-
-            unassigned_widget = QWidget()
-            unassigned_layout = QHBoxLayout(unassigned_widget)
-            unassigned_layout.setContentsMargins(5, 5, 5, 5)
-
-            color_label = QLabel()
-            color_label.setFixedSize(18, 18)
-            color_label.setStyleSheet("background-color: #95a5a6; border-radius: 2px;")
-            unassigned_layout.addWidget(color_label)
-
-            name_label = QLabel("Ohne Projekt")
-            name_font = QFont()
-            name_font.setPointSize(11)
-            name_font.setItalic(True)
-            name_label.setFont(name_font)
-            name_label.setStyleSheet("color: #7f8c8d;")
-            unassigned_layout.addWidget(name_label, stretch=1)
-
-            time_label = QLabel(f"{hours:.1f}h ({percentage:.0f}%)")
-            time_font = QFont()
-            time_font.setPointSize(11)
-            time_label.setFont(time_font)
-            time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            unassigned_layout.addWidget(time_label)
-
-            self.stats_layout.addWidget(unassigned_widget)
-
-        # --- App Statistics ---
-        app_header = QLabel("Zeit pro App")
-        app_header_font = QFont()
-        app_header_font.setPointSize(12)
-        app_header_font.setBold(True)
-        app_header.setFont(app_header_font)
-        app_header.setStyleSheet("margin-top: 15px; margin-bottom: 5px;")
-        self.stats_layout.addWidget(app_header)
-
-        # Group by app (use all activities, not filtered)
-        app_times = {}
-        for activity in all_activities:
-            if activity.get("is_idle", False):
-                continue
-
-            app_name = activity["app_name"]
-            duration = activity["duration"]
-
-            if app_name not in app_times:
-                app_times[app_name] = 0
-            app_times[app_name] += duration
+            self.unassigned_time_label.setText(f"{hours:.1f}h ({percentage:.0f}%)")
+        self.unassigned_widget.setVisible(unassigned_time > 0)
 
         # Sort apps by time (descending)
         sorted_apps = sorted(app_times.items(), key=lambda x: x[1], reverse=True)
 
         # Display top apps (limit to 10)
-        # Build app -> process_path mapping
-        app_paths = {}
-        for activity in all_activities:
-            if activity.get("process_path") and activity["app_name"] not in app_paths:
-                app_paths[activity["app_name"]] = activity["process_path"]
-
-        for app_name, seconds in sorted_apps[:10]:
+        top_apps = sorted_apps[:10]
+        for index, (app_name, seconds) in enumerate(top_apps):
             hours = seconds / 3600
             percentage = (seconds / total_seconds * 100) if total_seconds > 0 else 0
 
-            app_widget = QWidget()
-            app_layout = QHBoxLayout(app_widget)
-            app_layout.setContentsMargins(5, 5, 5, 5)
+            row = self._pooled_row(
+                self.app_rows,
+                index,
+                lambda: self._create_item_row(
+                    self.app_rows_layout, self.select_app_activities
+                ),
+            )
+            row.key = app_name
+            self._set_row_icon(row, app_paths.get(app_name))
+            row.name_label.setText(app_name)
+            row.time_label.setText(f"{hours:.1f}h ({percentage:.0f}%)")
 
-            # Try to get app icon
-            if app_name in app_paths:
-                icon_pixmap = self.icon_cache.get_icon_pixmap(
-                    app_paths[app_name], size=32
-                )
-                if icon_pixmap and not icon_pixmap.isNull():
-                    # Scale icon to exact size
-                    scaled_icon = icon_pixmap.scaled(
-                        24,
-                        24,
-                        Qt.AspectRatioMode.IgnoreAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
-                    icon_label = QLabel()
-                    icon_label.setPixmap(scaled_icon)
-                    icon_label.setFixedSize(24, 24)
-                    app_layout.addWidget(icon_label)
-
-            # App name (clickable)
-            name_label = QLabel(app_name)
-            name_font = QFont()
-            name_font.setPointSize(11)
-            name_label.setFont(name_font)
-            name_label.setCursor(Qt.CursorShape.PointingHandCursor)
-            name_label.mousePressEvent = lambda event, app=app_name: self.select_app_activities(app)
-            app_layout.addWidget(name_label, stretch=1)
-
-            # Time
-            time_label = QLabel(f"{hours:.1f}h ({percentage:.0f}%)")
-            time_font = QFont()
-            time_font.setPointSize(11)
-            time_label.setFont(time_font)
-            time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            app_layout.addWidget(time_label)
-
-            self.stats_layout.addWidget(app_widget)
+        self._hide_unused_rows(self.app_rows, len(top_apps))
 
         # Show "and X more" if there are more apps
         if len(sorted_apps) > 10:
-            more_label = QLabel(f"... und {len(sorted_apps) - 10} weitere Apps")
-            more_label.setStyleSheet(
-                "color: #7f8c8d; font-style: italic; padding: 5px;"
+            self.more_apps_label.setText(
+                f"... und {len(sorted_apps) - 10} weitere Apps"
             )
-            more_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.stats_layout.addWidget(more_label)
-
-        # --- File Statistics ---
-        file_header = QLabel("Zeit pro Datei")
-        file_header_font = QFont()
-        file_header_font.setPointSize(12)
-        file_header_font.setBold(True)
-        file_header.setFont(file_header_font)
-        file_header.setStyleSheet("margin-top: 15px; margin-bottom: 5px;")
-        self.stats_layout.addWidget(file_header)
-
-        # Extract filenames from window titles and group by file
-        file_times = {}
-        file_app_paths = {}  # Store app path for each file to get icon
-        for activity in all_activities:
-            if activity.get("is_idle", False):
-                continue
-
-            window_title = activity.get("window_title", "")
-            if not window_title:
-                continue
-
-            duration = activity["duration"]
-            app_name = activity["app_name"]
-            process_path = activity.get("process_path", "")
-
-            # Try to extract filename from window title
-            filename = self.extract_filename_from_title(window_title)
-            if filename and filename != "Keine Datei erkannt":
-                if filename not in file_times:
-                    file_times[filename] = 0
-                    if process_path:
-                        file_app_paths[filename] = process_path
-                file_times[filename] += duration
-
-        # Sort files by time (descending)
-        sorted_files = sorted(file_times.items(), key=lambda x: x[1], reverse=True)
+        self.more_apps_label.setVisible(len(sorted_apps) > 10)
 
-        # Display top files (limit to 10, only show files with > 60 seconds)
-        displayed_files = 0
-        for filename, seconds in sorted_files:
-            if seconds <= 60:  # Skip files with less than 1 minute
-                continue
-            if displayed_files >= 10:  # Limit to 10
-                break
+        # Sort files by time (descending), only files with > 60 seconds
+        sorted_files = sorted(
+            (f for f in file_times.items() if f[1] > 60),
+            key=lambda x: x[1],
+            reverse=True,
+        )
 
+        # Display top files (limit to 10)
+        top_files = sorted_files[:10]
+        for index, (filename, seconds) in enumerate(top_files):
             hours = seconds / 3600
             percentage = (seconds / total_seconds * 100) if total_seconds > 0 else 0
 
-            file_widget = QWidget()
-            file_layout = QHBoxLayout(file_widget)
-            file_layout.setContentsMargins(5, 5, 5, 5)
+            row = self._pooled_row(
+                self.file_rows,
+                index,
+                lambda: self._create_item_row(
+                    self.file_rows_layout, self.select_file_activities
+                ),
+            )
+            row.key = filename
+            self._set_row_icon(row, file_app_paths.get(filename))
+            row.name_label.setText(filename)
+            row.time_label.setText(f"{hours:.1f}h ({percentage:.0f}%)")
 
-            # Try to get app icon
-            if filename in file_app_paths:
-                icon_pixmap = self.icon_cache.get_icon_pixmap(
-                    file_app_paths[filename], size=32
-                )
-                if icon_pixmap and not icon_pixmap.isNull():
-                    # Scale icon to exact size
-                    scaled_icon = icon_pixmap.scaled(
-                        24,
-                        24,
-                        Qt.AspectRatioMode.IgnoreAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
-                    icon_label = QLabel()
-                    icon_label.setPixmap(scaled_icon)
-                    icon_label.setFixedSize(24, 24)
-                    file_layout.addWidget(icon_label)
-
-            # File name (clickable)
-            name_label = QLabel(filename)
-            name_font = QFont()
-            name_font.setPointSize(11)
-            name_label.setFont(name_font)
-            name_label.setCursor(Qt.CursorShape.PointingHandCursor)
-            name_label.mousePressEvent = lambda event, file=filename: self.select_file_activities(file)
-            file_layout.addWidget(name_label, stretch=1)
-
-            # Time
-            time_label = QLabel(f"{hours:.1f}h ({percentage:.0f}%)")
-            time_font = QFont()
-            time_font.setPointSize(11)
-            time_label.setFont(time_font)
-            time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            file_layout.addWidget(time_label)
-
-            self.stats_layout.addWidget(file_widget)
-            displayed_files += 1
+        self._hide_unused_rows(self.file_rows, len(top_files))
 
         # Show "and X more" if there are more files
-        remaining_files = len([f for f in sorted_files if f[1] > 60]) - displayed_files
+        remaining_files = len(sorted_files) - len(top_files)
         if remaining_files > 0:
-            more_label = QLabel(f"... und {remaining_files} weitere Dateien")
-            more_label.setStyleSheet(
-                "color: #7f8c8d; font-style: italic; padding: 5px;"
+            self.more_files_label.setText(
+                f"... und {remaining_files} weitere Dateien"
             )
-            more_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.stats_layout.addWidget(more_label)
+        self.more_files_label.setVisible(remaining_files > 0)
 
         # Show message if no files detected
-        if displayed_files == 0:
-            no_files_label = QLabel("Keine Dateien erkannt")
-            no_files_label.setStyleSheet(
-                "color: #7f8c8d; font-style: italic; padding: 5px;"
-            )
-            no_files_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.stats_layout.addWidget(no_files_label)
+        self.no_files_label.setVisible(not top_files)
 
     def extract_filename_from_title(self, window_title):
         """Extract filename or relevant content from window title"""
-        import re
-
-        if not window_title:
-            return None
-
-        # Pattern 1: Autodesk/CAD style - "Program - [filename.ext]" or "Program [filename.ext]"
-        autodesk_match = re.search(r"\[([^\]]+\.[a-zA-Z0-9]+)\]", window_title)
-        if autodesk_match:
-            return autodesk_match.group(1)
-
-        # Pattern 1b: Cyclone 3DR - "project_name - Cyclone 3DR version"
-        cyclone_match = re.match(r"^(.+?)\s*-\s*Cyclone 3DR", window_title)
-        if cyclone_match:
-            return cyclone_match.group(1).strip()
-
-        # Pattern 1c: Revit - "project_name - Autodesk Revit" or similar
-        revit_match = re.match(r"^(.+?)\s*-\s*(Autodesk\s+)?Revit", window_title)
-        if revit_match:
-            return revit_match.group(1).strip()
-
-        # Pattern 1d: Blender - "filename.blend - Blender" or "Blender - filename.blend"
-        blender_match = re.search(r"(.+?\.blend)", window_title)
-        if blender_match and "Blender" in window_title:
-            return blender_match.group(1).strip()
-
-        # Pattern 2: Teams chat - "Chat | Person Name | ..."
-        teams_match = re.search(r"Chat\s*\|\s*([^|]+?)\s*\|", window_title)
-        if teams_match:
-            return teams_match.group(1).strip()
-
-        # Pattern 3: Slack - "#channel-name | Workspace - Slack"
-        slack_match = re.search(r"^(#[^\|]+)\s*\|", window_title)
-        if slack_match:
-            return slack_match.group(1).strip()
-
-        # Pattern 4: Zoom - "Zoom Meeting - Meeting Name" or "Zoom Meeting"
-        zoom_match = re.match(r"^Zoom Meeting\s*-\s*(.+)", window_title)
-        if zoom_match:
-            return zoom_match.group(1).strip()
-
-        # Pattern 5: JetBrains IDEs - "filename.ext - Project [Path] - IDE"
-        jetbrains_match = re.match(
-            r"^([^\-]+\.[a-zA-Z0-9]+)\s*-\s*([^\[]+)", window_title
-        )
-        if jetbrains_match and (
-            "PyCharm" in window_title
-            or "IntelliJ" in window_title
-            or "WebStorm" in window_title
-            or "PhpStorm" in window_title
-        ):
-            filename = jetbrains_match.group(1).strip()
-            project = jetbrains_match.group(2).strip()
-            return f"{filename} - {project}"
-
-        # Pattern 6: VS Code style - "content... - Project - Visual Studio Code"
-        vscode_match = re.match(
-            r"^(.+?)\s*-\s*([^-]+)\s*-\s*Visual Studio Code", window_title
-        )
-        if vscode_match:
-            content = vscode_match.group(1).strip()
-            project = vscode_match.group(2).strip()
-            return f"{content} - {project}"
-
-        # Pattern 7: Microsoft Office - "filename.ext - Word/Excel/PowerPoint"
-        office_match = re.match(
-            r"^(.+?\.(docx?|xlsx?|pptx?|pdf))\s*-\s*(Microsoft\s+)?(Word|Excel|PowerPoint|Outlook)",
-            window_title,
-            re.IGNORECASE,
-        )
-        if office_match:
-            return office_match.group(1)
-
-        # Pattern 8: Adobe Reader/Acrobat - "filename.pdf - Adobe..."
-        adobe_match = re.match(r"^(.+?\.pdf)\s*-\s*Adobe", window_title, re.IGNORECASE)
-        if adobe_match:
-            return adobe_match.group(1)
-
-        # Pattern 9: Notepad++ - "filename.ext - Notepad++"
-        notepad_match = re.match(
-            r"^(.+?\.[a-zA-Z0-9]+)\s*-\s*Notepad\+\+", window_title
-        )
-        if notepad_match:
-            return notepad_match.group(1)
-
-        # Pattern 10: Browsers - "Page Title - Browser Name"
-        browser_match = re.match(
-            r"^(.+?)\s*-\s*(Google Chrome|Mozilla Firefox|Microsoft Edge|Opera|Safari|Brave)$",
-            window_title,
-        )
-        if browser_match:
-            page_title = browser_match.group(1).strip()
-            # Limit very long page titles
-            return page_title[:80] if len(page_title) > 80 else page_title
-
-        # Pattern 11: Outlook - various formats
-        if "Outlook" in window_title:
-            # Remove " - Outlook" suffix
-            outlook_cleaned = re.sub(
-                r"\s*-\s*(Microsoft\s+)?Outlook.*$", "", window_title
-            )
-            if outlook_cleaned:
-                # For inbox view, take first part
-                parts = outlook_cleaned.split(" - ")
-                return parts[0].strip()[:60]
-
-        # Pattern 12: Figma - "Design Name - Figma"
-        figma_match = re.match(r"^(.+?)\s*-\s*Figma$", window_title)
-        if figma_match:
-            return figma_match.group(1).strip()
-
-        # Pattern 13: General file with extension
-        file_match = re.search(r'([^\\/:\*\?"<>\|]+\.[a-zA-Z0-9]+)', window_title)
-        if file_match:
-            filename = file_match.group(1)
-            # Remove common application suffixes
-            filename = re.sub(
-                r"\s*-\s*(Visual Studio Code|Notepad|Word|Excel|PowerPoint|Adobe|Reader).*$",
-                "",
-                filename,
-            )
-            return filename.strip()
-
-        # Pattern 14: For other apps, extract first meaningful part
-        # Remove common app names at the end
-        cleaned = re.sub(
-            r"\s*-\s*(Microsoft Teams|Google Chrome|Firefox|Edge|Outlook|Discord|Spotify)$",
-            "",
-            window_title,
-        )
-
-        # If we removed something and there's still content, return it
-        if cleaned != window_title and cleaned.strip():
-            # Limit length and take first part if multiple separators
-            parts = cleaned.split(" - ")
-            if len(parts) > 0:
-                result = parts[0].strip()
-                return result[:60] if len(result) > 60 else result
-
-        return None
+        return _extract_filename_from_title(window_title)
 
     def previous_day(self):
         """Go to previous day"""
@@ -904,67 +1062,111 @@ class MainWindow(QMainWindow):
         self.load_timeline()
 
     def load_timeline(self):
-        """Load timeline for current date"""
-        start_datetime = datetime.combine(self.current_date, datetime.min.time())
-        end_datetime = datetime.combine(self.current_date, datetime.max.time())
+        """Load timeline for current date
+
+        The day is queried and summarized in the thread pool;
+        show_day_activities updates the views once it arrives. Only one load
+        runs at a time, a request while one is running reloads again after it.
+        """
+        self._dirty = False
+
+        if self._load_job is not None:
+            self._reload_pending = True
+            return
+
+        # Fetch the whole day once; the stats need it unfiltered and the
+        # timeline filters are applied in Python
+        job = TimelineLoadJob(self.database, self.current_date)
+        job.signals.loaded.connect(self.on_timeline_loaded)
+        job.signals.failed.connect(self.on_timeline_load_failed)
+        self._load_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def on_timeline_loaded(self, day, all_activities, stats):
+        """Show a finished load unless a newer one was requested meanwhile"""
+        self._load_job = None
+        if self._reload_pending or day != self.current_date:
+            self._reload_pending = False
+            self.load_timeline()
+            return
+
+        self._day_activities = all_activities
+        self._day_stats = stats
+        self.show_day_activities()
+
+    def on_timeline_load_failed(self, error):
+        """Report a failed load and run a reload requested meanwhile"""
+        self._load_job = None
+        print(f"Error loading timeline: {error}")
+        if self._reload_pending:
+            self._reload_pending = False
+            self.load_timeline()
 
+    def filter_activities(self, all_activities):
+        """Apply the project and app filters to the day's activities"""
         # Get selected filters
         selected_project = self.project_filter.currentData()
+        selected_app = self.app_filter.currentData()
 
-        # Handle "Ohne Projekt" filter
+        activities = all_activities
         if selected_project == "NO_PROJECT":
-            activities = self.database.get_activities(
-                start_date=start_datetime,
-                end_date=end_datetime,
-            )
-            # Filter to only activities without project
+            # Handle "Ohne Projekt" filter
             activities = [a for a in activities if a.get("project_id") is None]
-        else:
-            activities = self.database.get_activities(
-                start_date=start_datetime,
-                end_date=end_datetime,
-                project_id=selected_project,
-            )
+        elif selected_project:
+            activities = [
+                a for a in activities if a.get("project_id") == selected_project
+            ]
 
         # Apply app filter
-        selected_app = self.app_filter.currentData()
         if selected_app:
             activities = [a for a in activities if a["app_name"] == selected_app]
 
+        return activities
+
+    def show_day_activities(self):
+        """Update timeline, stats and filters from the loaded day"""
+        all_activities = self._day_activities
+        activities = self.filter_activities(all_activities)
+
         self.timeline.set_activities(activities, self.current_date)
-        self.update_stats(activities)
-        self.update_stats_sidebar(activities)
-        self.update_filter_options()
+        self.update_stats(activities, all_activities, self._day_stats)
+        self.update_stats_sidebar(activities, self._day_stats)
+        self.update_filter_options(all_activities)
         self.update_recent_projects_bar()
 
     def refresh_timeline(self):
         """Refresh the timeline"""
         self.load_timeline()
 
-    def update_stats(self, activities):
-        """Update statistics display"""
-        # Get ALL activities for the day for correct total time
-        start_datetime = datetime.combine(self.current_date, datetime.min.time())
-        end_datetime = datetime.combine(self.current_date, datetime.max.time())
-        all_activities = self.database.get_activities(
-            start_date=start_datetime, end_date=end_datetime
-        )
+    def schedule_refresh(self):
+        """Mark the timeline stale and refresh it shortly, once per burst"""
+        self._dirty = True
+        if self.isVisible() and not self._refresh_debounce.isActive():
+            self._refresh_debounce.start()
+
+    def refresh_if_dirty(self):
+        """Reload the timeline if data changed and the window is shown"""
+        if self._dirty and self.isVisible():
+            self.load_timeline()
 
+    def showEvent(self, event):
+        """Catch up on changes saved while the window was hidden"""
+        super().showEvent(event)
+        self.refresh_if_dirty()
+
+    def update_stats(self, activities, all_activities, stats):
+        """Update statistics display
+
+        Totals come from ``stats`` (the whole day), the filter hint compares
+        the filtered ``activities`` with ``all_activities``.
+        """
         if not all_activities:
             self.stats_label.setText("Keine Aktivitäten für diesen Tag")
             return
 
-        # Calculate total from all activities
-        total_seconds = sum(activity["duration"] for activity in all_activities)
-        active_seconds = sum(
-            activity["duration"]
-            for activity in all_activities
-            if not activity.get("is_idle", False)
-        )
-
-        total_hours = total_seconds / 3600
-        active_hours = active_seconds / 3600
-        idle_hours = (total_seconds - active_seconds) / 3600
+        total_hours = (stats.active_seconds + stats.idle_seconds) / 3600
+        active_hours = stats.active_seconds / 3600
+        idle_hours = stats.idle_seconds / 3600
 
         # Show filtered count if filter is active
         filter_info = ""
@@ -1032,16 +1234,8 @@ class MainWindow(QMainWindow):
                 return True  # Event handled, block scrolling completely
         return super().eventFilter(obj, event)
 
-    def update_filter_options(self):
-        """Update filter dropdown options based on current date"""
-        start_datetime = datetime.combine(self.current_date, datetime.min.time())
-        end_datetime = datetime.combine(self.current_date, datetime.max.time())
-
-        # Get all activities for this date
-        all_activities = self.database.get_activities(
-            start_date=start_datetime, end_date=end_datetime
-        )
-
+    def update_filter_options(self, all_activities):
+        """Update filter dropdown options from the current day's activities"""
         # Get unique apps
         apps = sorted(set(a["app_name"] for a in all_activities))
         current_app = self.app_filter.currentData()
@@ -1081,7 +1275,11 @@ class MainWindow(QMainWindow):
 
     def apply_filters(self):
         """Apply selected filters"""
-        self.load_timeline()
+        if self._dirty or self._load_job is not None:
+            self.load_timeline()
+        else:
+            # The loaded day is current, filter it without a new query
+            self.show_day_activities()
 
     def clear_filters(self):
         """Clear all filters"""
@@ -1096,55 +1294,19 @@ class MainWindow(QMainWindow):
             self.app_filter.setCurrentIndex(app_index)
 
         # Get all activities matching the current filter (which now includes the app)
-        start_datetime = datetime.combine(self.current_date, datetime.min.time())
-        end_datetime = datetime.combine(self.current_date, datetime.max.time())
-
-        selected_project = self.project_filter.currentData()
-
-        # Handle "Ohne Projekt" filter
-        if selected_project == "NO_PROJECT":
-            activities = self.database.get_activities(
-                start_date=start_datetime,
-                end_date=end_datetime,
-            )
-            activities = [a for a in activities if a.get("project_id") is None and a["app_name"] == app_name]
-        else:
-            activities = self.database.get_activities(
-                start_date=start_datetime,
-                end_date=end_datetime,
-                project_id=selected_project,
-            )
-            activities = [a for a in activities if a["app_name"] == app_name]
+        activities = [
+            a
+            for a in self.filter_activities(self._day_activities)
+            if a["app_name"] == app_name
+        ]
 
         # Select all activities in timeline
         self.timeline.select_all_activities(activities)
 
     def select_file_activities(self, filename):
         """Select all activities for a specific file"""
-        # Get all activities for the day
-        start_datetime = datetime.combine(self.current_date, datetime.min.time())
-        end_datetime = datetime.combine(self.current_date, datetime.max.time())
-
-        selected_project = self.project_filter.currentData()
-
-        # Handle "Ohne Projekt" filter
-        if selected_project == "NO_PROJECT":
-            activities = self.database.get_activities(
-                start_date=start_datetime,
-                end_date=end_datetime,
-            )
-            activities = [a for a in activities if a.get("project_id") is None]
-        else:
-            activities = self.database.get_activities(
-                start_date=start_datetime,
-                end_date=end_datetime,
-                project_id=selected_project,
-            )
-
-        # Apply app filter if active
-        selected_app = self.app_filter.currentData()
-        if selected_app:
-            activities = [a for a in activities if a["app_name"] == selected_app]
+        # Get all activities of the day matching the current filters
+        activities = self.filter_activities(self._day_activities)
 
         # Filter by filename extracted from window title
         matching_activities = []
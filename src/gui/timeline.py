@@ -309,14 +309,15 @@ class TimelineWidget(QWidget):
                 text_offset = 5
 
                 if activity.get('process_path'):
-                    icon_pixmap = self.icon_cache.get_icon_pixmap(activity['process_path'], size=16)
+                    # Scaled to fit once per path, not on every paint
+                    icon_pixmap = self.icon_cache.get_scaled_icon_pixmap(
+                        activity['process_path'], size=16, display_size=14
+                    )
 
                 if icon_pixmap and not icon_pixmap.isNull():
-                    # Scale icon to fit properly
-                    scaled_icon = icon_pixmap.scaled(14, 14, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
                     # Draw icon
                     icon_y = rect.y() + 2
-                    painter.drawPixmap(rect.x() + 3, icon_y, scaled_icon)
+                    painter.drawPixmap(rect.x() + 3, icon_y, icon_pixmap)
                     text_offset = 20  # Make room for icon
 
                 painter.setPen(QPen(QColor(255, 255, 255), 1))
@@ -576,19 +577,17 @@ class TimelineWidget(QWidget):
 
     def assign_multiple_to_project(self, activities, project_id):
         """Assign multiple activities to a project"""
-        total_count = 0
-
-        for activity in activities:
-            # Use the merged activity's time range to assign ALL activities in that range
-            start_time = activity['timestamp']
-            end_time = activity.get('end_time', start_time + timedelta(seconds=activity['duration']))
-            app_name = activity['app_name']
-
-            # Assign all activities in this time range for this app
-            count = self.database.assign_activities_by_timerange(
-                start_time, end_time, app_name, project_id
+        # Use each merged activity's time range to assign ALL activities in that
+        # range, for all selected activities in one transaction
+        timeranges = [
+            (
+                activity['timestamp'],
+                activity.get('end_time', activity['timestamp'] + timedelta(seconds=activity['duration'])),
+                activity['app_name'],
             )
-            total_count += count
+            for activity in activities
+        ]
+        total_count = self.database.assign_activities_bulk(timeranges, project_id)
 
         print(f"Assigned {total_count} activities to project")
 
@@ -1,5 +1,6 @@
 """Configuration and constants"""
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Default processes to ignore (system processes, not relevant for tracking)
@@ -51,14 +52,25 @@ def get_ignored_window_titles():
 IGNORED_PROCESSES = get_ignored_processes()
 IGNORED_WINDOW_TITLES = get_ignored_window_titles()
 
-def should_ignore_activity(app_name, window_title=''):
-    """Check if an activity should be ignored"""
-    # Get latest values from environment
+@lru_cache(maxsize=8)
+def _ignore_rules(procs_env, titles_env):
+    """Parse the blacklists once per distinct environment value
+
+    Returns lowercased process names and window titles as frozensets.
+    """
     ignored_procs = get_ignored_processes()
     ignored_titles = get_ignored_window_titles()
+    return frozenset(p.lower() for p in ignored_procs), frozenset(ignored_titles)
+
+def should_ignore_activity(app_name, window_title=''):
+    """Check if an activity should be ignored"""
+    # Keyed on the raw environment values, so settings changes still apply
+    ignored_procs, ignored_titles = _ignore_rules(
+        os.getenv('IGNORED_PROCESSES', ''), os.getenv('IGNORED_WINDOW_TITLES', '')
+    )
 
     # Ignore based on process name
-    if app_name.lower() in {p.lower() for p in ignored_procs}:
+    if app_name.lower() in ignored_procs:
         return True
 
     # Ignore based on window title
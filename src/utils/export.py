@@ -14,17 +14,43 @@ class Exporter:
         self.database = database
 
     def export_csv(self, start_date, end_date, filepath):
-        """Export activities to CSV file"""
-        activities = self.database.get_activities(
+        """Export activities to CSV file
+
+        Activities are streamed from the database and written as plain rows,
+        so large ranges are never held in memory as a whole.
+        """
+        activities = self.database.iter_activities(
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            columns=('timestamp', 'duration', 'app_name', 'window_title', 'project_id', 'is_idle'),
         )
 
         # Get project mapping
         projects = {p['id']: p['name'] for p in self.database.get_projects()}
 
+        count = 0
+
+        def rows():
+            nonlocal count
+            for activity in activities:
+                count += 1
+                timestamp = activity['timestamp']
+                end_time = timestamp + timedelta(seconds=activity['duration'])
+
+                yield (
+                    timestamp.strftime('%Y-%m-%d'),
+                    timestamp.strftime('%H:%M:%S'),
+                    end_time.strftime('%H:%M:%S'),
+                    round(activity['duration'] / 60, 2),
+                    activity['app_name'],
+                    activity['window_title'] or '',
+                    projects.get(activity['project_id'], '') if activity['project_id'] else '',
+                    'Ja' if activity['is_idle'] else 'Nein',
+                )
+
         with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
+            writer = csv.writer(csvfile)
+            writer.writerow([
                 'Datum',
                 'Startzeit',
                 'Endzeit',
@@ -33,38 +59,18 @@ class Exporter:
                 'Fenster-Titel',
                 'Projekt',
                 'Idle'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            writer.writeheader()
+            ])
+            writer.writerows(rows())
 
-            for activity in activities:
-                timestamp = activity['timestamp']
-                duration_minutes = round(activity['duration'] / 60, 2)
-                end_time = timestamp + timedelta(seconds=activity['duration'])
-
-                project_name = ''
-                if activity.get('project_id'):
-                    project_name = projects.get(activity['project_id'], '')
-
-                writer.writerow({
-                    'Datum': timestamp.strftime('%Y-%m-%d'),
-                    'Startzeit': timestamp.strftime('%H:%M:%S'),
-                    'Endzeit': end_time.strftime('%H:%M:%S'),
-                    'Dauer (Minuten)': duration_minutes,
-                    'Programm': activity['app_name'],
-                    'Fenster-Titel': activity.get('window_title', ''),
-                    'Projekt': project_name,
-                    'Idle': 'Ja' if activity.get('is_idle') else 'Nein'
-                })
-
-        return len(activities)
+        return count
 
     def export_project_summary_csv(self, start_date, end_date, filepath):
         """Export project summary to CSV"""
-        activities = self.database.get_activities(
+        # Only the columns needed for the aggregation (no window titles)
+        activities = self.database.iter_activities(
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            columns=('duration', 'project_id', 'is_idle'),
         )
 
         # Get projects
@@ -9,6 +9,7 @@ import os
 import sys
 from typing import Optional
 
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QImage, QPixmap
 
 logger = logging.getLogger(__name__)
@@ -29,11 +30,14 @@ class IconCache:
 
     Attributes:
         cache: Dictionary mapping cache keys to QPixmap objects
+        scaled_cache: Dictionary mapping (path, size, display size) to
+            already scaled QPixmap objects
     """
 
     def __init__(self):
         """Initialize empty icon cache."""
         self.cache: dict[str, QPixmap] = {}
+        self.scaled_cache: dict[tuple[str, int, int], QPixmap] = {}
 
     def get_icon_pixmap(self, exe_path: Optional[str], size: int = 16) -> Optional[QPixmap]:
         """Get icon pixmap for executable path.
@@ -61,6 +65,40 @@ class IconCache:
 
         return None
 
+    def get_scaled_icon_pixmap(
+        self, exe_path: Optional[str], size: int, display_size: int
+    ) -> Optional[QPixmap]:
+        """Get icon pixmap for executable path, smoothly scaled for display.
+
+        The scaled pixmap is cached as well, so widgets that are rebuilt on
+        every refresh do not repeat the resample.
+
+        Args:
+            exe_path: Path to the executable file
+            size: Icon size in pixels to extract
+            display_size: Width and height of the returned pixmap
+
+        Returns:
+            Scaled QPixmap of the icon, or None if extraction fails
+        """
+        cache_key = (exe_path, size, display_size)
+
+        if cache_key in self.scaled_cache:
+            return self.scaled_cache[cache_key]
+
+        pixmap = self.get_icon_pixmap(exe_path, size)
+        if not pixmap or pixmap.isNull():
+            return None
+
+        scaled = pixmap.scaled(
+            display_size,
+            display_size,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        self.scaled_cache[cache_key] = scaled
+        return scaled
+
     def _extract_windows_icon(self, exe_path: str, size: int) -> Optional[QPixmap]:
         """Extract icon from Windows executable.
 
@@ -156,6 +194,7 @@ class IconCache:
     def clear(self) -> None:
         """Clear the icon cache."""
         self.cache.clear()
+        self.scaled_cache.clear()
 
     def __len__(self) -> int:
         """Return number of cached icons."""
@@ -8,7 +8,9 @@ Verwendet Pattern-Matching und statistische Analyse.
 import logging
 import re
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Any, Optional
 
 from core.database_protocol import DatabaseProtocol
@@ -260,41 +262,57 @@ class SmartProjectAssigner:
         Returns:
             Liste von Vorschlägen mit Aktivität und Projekt
         """
+        suggestions = list(
+            self.iter_suggestions_for_review(
+                start_date=start_date, end_date=end_date, limit=limit, min_duration=min_duration
+            )
+        )
+
+        # Sortiere nach Konfidenz (höchste zuerst)
+        suggestions.sort(key=lambda x: x["confidence"], reverse=True)
+
+        return suggestions
+
+    def iter_suggestions_for_review(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        min_duration: int = 60,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Liefert Vorschläge zur manuellen Review nacheinander (neueste zuerst)
+
+        Aktivitäten werden aus der Datenbank gestreamt, es wird nie der ganze
+        Zeitraum auf einmal geladen. Argumente wie get_suggestions_for_review;
+        limit=None liefert alle Vorschläge.
+        """
         self.learn_from_history()
 
         # Hole nicht zugeordnete Aktivitäten
-        activities = self.database.get_activities(start_date=start_date, end_date=end_date)
+        activities = self.database.iter_activities(start_date=start_date, end_date=end_date)
 
         # Filtere nach nicht zugeordnet UND Mindestdauer (ignoriere sehr kurze Aktivitäten)
-        unassigned = [
+        unassigned = (
             a for a in activities
             if not a.get("project_id") and a.get("duration", 0) >= min_duration
-        ]
+        )
 
         # Hole Projekt-Namen
         projects = {p["id"]: p for p in self.database.get_projects()}
 
-        suggestions = []
-
-        for activity in unassigned[:limit]:
+        for activity in islice(unassigned, limit):
             suggested_project_id = self.suggest_project(activity)
 
             if suggested_project_id:
                 confidence = self.get_confidence(activity, suggested_project_id)
                 project = projects.get(suggested_project_id)
 
-                suggestions.append(
-                    {
-                        "activity": activity,
-                        "suggested_project_id": suggested_project_id,
-                        "suggested_project_name": project["name"] if project else "Unknown",
-                        "suggested_project_color": project["color"] if project else "#999",
-                        "confidence": confidence,
-                        "confidence_percent": f"{confidence:.0%}",
-                    }
-                )
-
-        # Sortiere nach Konfidenz (höchste zuerst)
-        suggestions.sort(key=lambda x: x["confidence"], reverse=True)
-
-        return suggestions
+                yield {
+                    "activity": activity,
+                    "suggested_project_id": suggested_project_id,
+                    "suggested_project_name": project["name"] if project else "Unknown",
+                    "suggested_project_color": project["color"] if project else "#999",
+                    "confidence": confidence,
+                    "confidence_percent": f"{confidence:.0%}",
+                }
@@ -4,7 +4,8 @@ Pytest configuration and fixtures
 import sys
 from pathlib import Path
 import pytest
-from datetime import datetime
+from datetime import date, datetime, time
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 # Add src to path
@@ -52,6 +53,10 @@ class MockDatabase(DatabaseProtocol):
 
         return activity_id
 
+    def save_activities(self, activities: list[dict[str, Any]]) -> list[int]:
+        """Save several activities and return their IDs"""
+        return [self.save_activity(**activity) for activity in activities]
+
     def get_activities(
         self,
         start_date: datetime | None = None,
@@ -72,6 +77,26 @@ class MockDatabase(DatabaseProtocol):
 
         return sorted(result, key=lambda x: x["timestamp"], reverse=True)
 
+    def get_activities_for_day(self, day: date) -> list[dict[str, Any]]:
+        """Get activities of one day"""
+        return self.get_activities(
+            datetime.combine(day, time.min), datetime.combine(day, time.max)
+        )
+
+    def iter_activities(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        project_id: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate activities with filters"""
+        for activity in self.get_activities(start_date, end_date, project_id):
+            if columns is None:
+                yield activity
+            else:
+                yield {column: activity.get(column) for column in columns}
+
     def create_project(self, name: str, color: str = "#3498db") -> int:
         """Create project and return ID"""
         project_id = self._project_id_counter
@@ -89,6 +114,13 @@ class MockDatabase(DatabaseProtocol):
         """Get all projects"""
         return sorted(self.projects, key=lambda x: x["name"])
 
+    def delete_project(self, project_id: int) -> None:
+        """Delete project and unassign its activities"""
+        self.projects = [p for p in self.projects if p["id"] != project_id]
+        for activity in self.activities:
+            if activity.get("project_id") == project_id:
+                activity["project_id"] = None
+
     def assign_activity_to_project(self, activity_id: int, project_id: int) -> None:
         """Assign activity to project"""
         for activity in self.activities:
@@ -96,6 +128,27 @@ class MockDatabase(DatabaseProtocol):
                 activity["project_id"] = project_id
                 break
 
+    def assign_multiple_activities_to_project(
+        self, activity_ids: list[int], project_id: int
+    ) -> int:
+        """Assign several activities to project"""
+        count = 0
+        for activity in self.activities:
+            if activity["id"] in activity_ids:
+                activity["project_id"] = project_id
+                count += 1
+        return count
+
+    def assign_activities_to_projects(self, assignments: Sequence[tuple[int, int]]) -> int:
+        """Assign activities to projects from (project_id, activity_id) pairs"""
+        project_by_activity = {activity_id: project_id for project_id, activity_id in assignments}
+        count = 0
+        for activity in self.activities:
+            if activity["id"] in project_by_activity:
+                activity["project_id"] = project_by_activity[activity["id"]]
+                count += 1
+        return count
+
     def assign_activities_by_timerange(
         self, start_time: datetime, end_time: datetime, app_name: str, project_id: int
     ) -> int:
@@ -111,6 +164,17 @@ class MockDatabase(DatabaseProtocol):
                 count += 1
         return count
 
+    def assign_activities_bulk(
+        self,
+        timeranges: Sequence[tuple[datetime, datetime, str]],
+        project_id: int | None,
+    ) -> int:
+        """Assign activities of several timeranges to project"""
+        return sum(
+            self.assign_activities_by_timerange(start_time, end_time, app_name, project_id)
+            for start_time, end_time, app_name in timeranges
+        )
+
     def get_setting(self, key: str, default: str | None = None) -> str | None:
         """Get setting value"""
         return self.settings.get(key, default)
@@ -119,6 +183,17 @@ class MockDatabase(DatabaseProtocol):
         """Set setting value"""
         self.settings[key] = value
 
+    def get_social_media_project_id(self) -> int | None:
+        """Get Social Media project ID"""
+        for project in self.projects:
+            if project["name"] == "Social Media":
+                return project["id"]
+        return None
+
+    def checkpoint(self) -> None:
+        """Checkpoint database (no-op for mock)"""
+        pass
+
     def close(self) -> None:
         """Close database (no-op for mock)"""
         pass
@@ -2,12 +2,13 @@
 Tests for database functionality
 """
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import tempfile
 import sqlite3
+import threading
 from pathlib import Path
 
-from core.database import Database
+from core.database import SCHEMA_VERSION, Database
 
 
 class TestDatabase:
@@ -66,6 +67,47 @@ class TestDatabase:
         assert activities[0]["window_title"] == "main.py - VSCode"
         assert activities[0]["duration"] == 1800  # 30 minutes in seconds
 
+    def test_save_activities_batch(self, temp_db):
+        """Test saving several activities in one transaction"""
+        activity_ids = temp_db.save_activities([
+            {
+                "app_name": "App1",
+                "window_title": "T1",
+                "start_time": datetime(2024, 1, 15, 9, 0),
+                "end_time": datetime(2024, 1, 15, 10, 0),
+            },
+            {
+                "app_name": "App2",
+                "window_title": "T2",
+                "start_time": datetime(2024, 1, 15, 10, 0),
+                "end_time": datetime(2024, 1, 15, 11, 0),
+                "is_idle": True,
+            },
+        ])
+
+        assert len(activity_ids) == 2
+        assert all(activity_id > 0 for activity_id in activity_ids)
+        assert not temp_db.conn.in_transaction
+
+        activities = temp_db.get_activities()
+        assert [a["app_name"] for a in activities] == ["App2", "App1"]
+        assert activities[0]["is_idle"] == 1
+
+    def test_save_activities_empty(self, temp_db):
+        """Test that an empty batch is a no-op"""
+        assert temp_db.save_activities([]) == []
+
+    def test_duplicate_activity_skipped(self, temp_db):
+        """Test that an exact duplicate insert is skipped and reports ID 0"""
+        start = datetime(2024, 1, 15, 10, 0)
+        end = datetime(2024, 1, 15, 11, 0)
+        assert temp_db.save_activity("App1", "Title1", start, end) > 0
+
+        # Bypass overlap resolution so the insert reaches idx_unique_activity
+        temp_db._end_watermark = start
+        assert temp_db.save_activity("App1", "Title1", start, end) == 0
+        assert len(temp_db.get_activities()) == 1
+
     def test_get_activities_with_date_filter(self, temp_db):
         """Test filtering activities by date"""
         # Add activities on different dates
@@ -88,6 +130,81 @@ class TestDatabase:
         assert len(activities) == 1
         assert activities[0]["app_name"] == "App2"
 
+    def test_get_activities_for_day(self, temp_db):
+        """Test that only activities of the given calendar day are returned"""
+        temp_db.save_activity(
+            "Late", "Title", datetime(2024, 1, 14, 23, 59, 30), datetime(2024, 1, 14, 23, 59, 50)
+        )
+        temp_db.save_activity(
+            "First", "Title", datetime(2024, 1, 15, 0, 0), datetime(2024, 1, 15, 1, 0)
+        )
+        temp_db.save_activity(
+            "Last", "Title", datetime(2024, 1, 15, 23, 59, 59, 500000), datetime(2024, 1, 16, 0, 30)
+        )
+
+        activities = temp_db.get_activities_for_day(date(2024, 1, 15))
+
+        assert [a["app_name"] for a in activities] == ["Last", "First"]
+
+    def test_iter_activities_with_columns(self, temp_db):
+        """Test streaming activities with a reduced column set"""
+        temp_db.save_activity(
+            "App1", "Title1", datetime(2024, 1, 15, 10, 0), datetime(2024, 1, 15, 11, 0)
+        )
+        temp_db.save_activity(
+            "App2", "Title2", datetime(2024, 1, 15, 11, 0), datetime(2024, 1, 15, 12, 0)
+        )
+
+        rows = list(temp_db.iter_activities(columns=("timestamp", "app_name", "duration")))
+
+        assert rows == [
+            {"timestamp": datetime(2024, 1, 15, 11, 0), "app_name": "App2", "duration": 3600},
+            {"timestamp": datetime(2024, 1, 15, 10, 0), "app_name": "App1", "duration": 3600},
+        ]
+
+    def test_iter_activities_rejects_unknown_columns(self, temp_db):
+        """Test that only known activity columns can be selected"""
+        with pytest.raises(ValueError):
+            list(temp_db.iter_activities(columns=("app_name", "1; DROP TABLE activities")))
+
+    def test_timerange_by_app_uses_composite_index(self, temp_db):
+        """Test that app + time range filters seek on idx_activities_app_ts"""
+        plan = temp_db.conn.execute('''
+            EXPLAIN QUERY PLAN
+            DELETE FROM activities
+            WHERE timestamp >= ? AND timestamp <= ? AND app_name = ?
+        ''', (datetime(2024, 1, 15), datetime(2024, 1, 16), "App1")).fetchall()
+
+        assert any("idx_activities_app_ts" in row[3] for row in plan)
+
+    def test_timestamp_columns_parsed_on_fetch(self, temp_db):
+        """Test that TIMESTAMP columns are returned as datetime objects"""
+        temp_db.create_project("Project")
+        temp_db.save_activity(
+            "App1", "Title1", datetime(2024, 1, 15, 10, 0, 0, 250000), datetime(2024, 1, 15, 11, 0)
+        )
+
+        activity = temp_db.get_activities()[0]
+        assert activity['timestamp'] == datetime(2024, 1, 15, 10, 0, 0, 250000)
+
+        project = [p for p in temp_db.get_projects() if p['name'] == "Project"][0]
+        assert isinstance(project['created_at'], datetime)
+
+    def test_recently_used_projects_use_partial_index(self, temp_db):
+        """Test that recently used projects are read from idx_projects_last_used"""
+        plan = temp_db.conn.execute('''
+            EXPLAIN QUERY PLAN
+            SELECT id, name, color, last_used
+            FROM projects
+            WHERE last_used IS NOT NULL
+            ORDER BY last_used DESC
+            LIMIT ?
+        ''', (10,)).fetchall()
+
+        details = [row[3] for row in plan]
+        assert any("idx_projects_last_used" in detail for detail in details)
+        assert not any("TEMP B-TREE" in detail for detail in details)
+
     def test_create_project(self, temp_db):
         """Test creating a project"""
         project_id = temp_db.create_project("Test Project", "#FF5733")
@@ -131,6 +248,24 @@ class TestDatabase:
         assert len(activities) == 1
         assert activities[0]["project_id"] == project_id
 
+    def test_assign_multiple_activities_to_project(self, temp_db):
+        """Test assigning a list of activities to a project"""
+        project_id = temp_db.create_project("Multi Project")
+
+        activity_ids = [
+            temp_db.save_activity(
+                "App", f"T{hour}", datetime(2024, 1, 15, hour, 0), datetime(2024, 1, 15, hour, 30)
+            )
+            for hour in (9, 10, 11)
+        ]
+
+        affected = temp_db.assign_multiple_activities_to_project(activity_ids[:2], project_id)
+
+        assert affected == 2
+        assigned = temp_db.get_activities(project_id=project_id)
+        assert sorted(a["id"] for a in assigned) == sorted(activity_ids[:2])
+        assert temp_db.assign_multiple_activities_to_project([], project_id) == 0
+
     def test_assign_activities_by_timerange(self, temp_db):
         """Test assigning multiple activities by timerange"""
         # Create project
@@ -171,6 +306,43 @@ class TestDatabase:
         assert len(activities) == 2
         assert all(a["app_name"] == "Code.exe" for a in activities)
 
+    def test_assign_activities_bulk(self, temp_db):
+        """Test assigning several app time ranges in one call"""
+        project_id = temp_db.create_project("Bulk")
+        base = datetime(2024, 1, 15, 10, 0)
+        for i, app in enumerate(["App1", "App2", "App1", "App3"]):
+            start = base + timedelta(minutes=10 * i)
+            temp_db.save_activity(app, f"Title{i}", start, start + timedelta(minutes=5))
+
+        count = temp_db.assign_activities_bulk(
+            [
+                (base, base + timedelta(minutes=25), "App1"),
+                (base, base + timedelta(minutes=15), "App2"),
+            ],
+            project_id,
+        )
+
+        assert count == 3
+        assigned = {a["window_title"] for a in temp_db.get_activities(project_id=project_id)}
+        assert assigned == {"Title0", "Title1", "Title2"}
+        assert temp_db.get_recently_used_projects()[0]["id"] == project_id
+
+    def test_assign_activities_to_projects(self, temp_db):
+        """Test assigning activities to different projects in one call"""
+        work = temp_db.create_project("Work")
+        private = temp_db.create_project("Private")
+        base = datetime(2024, 1, 15, 10, 0)
+        ids = [
+            temp_db.save_activity("App", f"Title{i}", base + timedelta(minutes=i), base + timedelta(minutes=i, seconds=30))
+            for i in range(3)
+        ]
+
+        count = temp_db.assign_activities_to_projects([(work, ids[0]), (private, ids[2])])
+
+        assert count == 2
+        projects = {a["id"]: a["project_id"] for a in temp_db.get_activities()}
+        assert projects == {ids[0]: work, ids[1]: None, ids[2]: private}
+
     def test_settings(self, temp_db):
         """Test settings storage"""
         # Set a setting
@@ -188,6 +360,30 @@ class TestDatabase:
         temp_db.set_setting("theme", "light")
         assert temp_db.get_setting("theme") == "light"
 
+    def test_settings_cache_ignores_read_racing_with_write(self, temp_db):
+        """Test that a read overtaken by set_setting does not cache the old value"""
+        temp_db.set_setting("theme", "dark")
+        temp_db._settings_cache.clear()
+        read_conn = temp_db._read_conn()
+
+        class RacingConn:
+            """Reads the old value, then lets set_setting commit before returning"""
+
+            def execute(self, sql, params):
+                cursor = read_conn.execute(sql, params)
+                row = cursor.fetchone()
+                temp_db.set_setting("theme", "light")
+                return type("Result", (), {"fetchone": lambda self: row})()
+
+        original_read_conn = temp_db._read_conn
+        temp_db._read_conn = lambda: RacingConn()
+        try:
+            assert temp_db.get_setting("theme") == "dark"
+        finally:
+            temp_db._read_conn = original_read_conn
+
+        assert temp_db.get_setting("theme") == "light"
+
     def test_idle_activities(self, temp_db):
         """Test tracking idle activities"""
         activity_id = temp_db.save_activity(
@@ -245,3 +441,309 @@ class TestDatabase:
         # Check that activity's project_id is now NULL
         activities = temp_db.get_activities()
         assert activities[0]["project_id"] is None
+
+    def test_wal_journal_mode(self, temp_db):
+        """Test that file databases are opened in WAL mode with tuned PRAGMAs"""
+        cursor = temp_db.conn.cursor()
+        assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # synchronous=NORMAL is reported as 1
+        assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert cursor.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert cursor.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        cursor.close()
+
+        # Read-only connections share the page cache and timeout tuning
+        reader = temp_db._read_conn()
+        assert reader.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        assert reader.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+        assert reader.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_in_memory_database(self):
+        """Test that an in-memory database works without WAL"""
+        db = Database(":memory:")
+        try:
+            activity_id = db.save_activity(
+                "App", "Title", datetime(2024, 1, 15, 10, 0), datetime(2024, 1, 15, 11, 0)
+            )
+            assert activity_id > 0
+            assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        finally:
+            db.close()
+
+    def test_schema_version_recorded(self, temp_db):
+        """Test that a fresh database is stamped with the current schema version"""
+        assert temp_db.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    def test_migrates_legacy_database(self, tmp_path):
+        """Test that a database without last_used is migrated and stamped"""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute('''
+            CREATE TABLE projects (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                color TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE activities (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TIMESTAMP NOT NULL,
+                app_name TEXT NOT NULL,
+                window_title TEXT,
+                duration INTEGER NOT NULL,
+                category TEXT,
+                project_id INTEGER,
+                is_idle BOOLEAN DEFAULT 0,
+                process_path TEXT,
+                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE SET NULL
+            )
+        ''')
+        conn.execute(
+            "INSERT INTO activities (timestamp, app_name, window_title, duration) "
+            "VALUES ('2024-01-15 10:00:00', 'App1', 'Title1', 60)"
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(str(db_path))
+        try:
+            columns = [row[1] for row in db.conn.execute("PRAGMA table_info(projects)")]
+            assert 'last_used' in columns
+            assert db.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+            # Existing data is analyzed once during the upgrade
+            stats = db.conn.execute("SELECT idx FROM sqlite_stat1").fetchall()
+            assert "idx_activities_app_ts" in {row[0] for row in stats}
+
+            # Existing data is vacuumed once to switch to incremental auto_vacuum
+            assert db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        finally:
+            db.close()
+
+    def test_failed_upgrade_vacuum_is_retried(self, tmp_path, monkeypatch):
+        """Test that a failing migration VACUUM neither breaks opening nor is skipped"""
+        db_path = tmp_path / "old.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE t (x)")
+        conn.close()
+        Database(str(db_path)).close()
+
+        # Back to a version 3 database without incremental auto_vacuum
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA auto_vacuum = NONE")
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA user_version = 3")
+        conn.close()
+
+        class BusyVacuumConnection(sqlite3.Connection):
+            def execute(self, sql, *args):
+                if sql == "VACUUM":
+                    raise sqlite3.OperationalError("database is locked")
+                return super().execute(sql, *args)
+
+        real_connect = sqlite3.connect
+        monkeypatch.setattr(
+            sqlite3, "connect",
+            lambda *args, **kwargs: real_connect(*args, factory=BusyVacuumConnection, **kwargs),
+        )
+        db = Database(str(db_path))
+        try:
+            assert db.conn.execute("PRAGMA user_version").fetchone()[0] == 3
+            assert db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2
+        finally:
+            db.close()
+
+        monkeypatch.setattr(sqlite3, "connect", real_connect)
+        db = Database(str(db_path))
+        try:
+            assert db.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+            assert db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        finally:
+            db.close()
+
+    def test_incremental_auto_vacuum(self, temp_db):
+        """Test that new databases use incremental auto_vacuum"""
+        # INCREMENTAL is reported as 2
+        assert temp_db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    def test_checkpoint_truncates_wal(self, temp_db):
+        """Test that checkpoint() empties the WAL file"""
+        temp_db.save_activity(
+            "App1", "Title1", datetime(2024, 1, 15, 10, 0), datetime(2024, 1, 15, 11, 0)
+        )
+        assert Path(temp_db.db_path + "-wal").stat().st_size > 0
+
+        temp_db.checkpoint()
+
+        assert Path(temp_db.db_path + "-wal").stat().st_size == 0
+
+    def test_checkpoint_releases_free_pages(self, temp_db):
+        """Test that checkpoint() hands all pages freed by deletes back"""
+        start = datetime(2024, 1, 15, 0, 0)
+        temp_db.save_activities([
+            {
+                "app_name": "App",
+                "window_title": "x" * 500,
+                "start_time": start + timedelta(minutes=i),
+                "end_time": start + timedelta(minutes=i, seconds=30),
+                "is_idle": False,
+            }
+            for i in range(1000)
+        ])
+        temp_db.delete_activities_by_timerange(start, start + timedelta(days=1), "App")
+        assert temp_db.conn.execute("PRAGMA freelist_count").fetchone()[0] > 1
+
+        temp_db.checkpoint()
+
+        assert temp_db.conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    def test_maintenance_analyzes_and_truncates_wal(self, temp_db):
+        """Test that maintenance() writes planner statistics and empties the WAL"""
+        temp_db.save_activity(
+            "App1", "Title1", datetime(2024, 1, 15, 10, 0), datetime(2024, 1, 15, 11, 0)
+        )
+
+        temp_db.maintenance()
+
+        stats = temp_db.conn.execute("SELECT tbl FROM sqlite_stat1").fetchall()
+        assert "activities" in {row[0] for row in stats}
+        assert Path(temp_db.db_path + "-wal").stat().st_size == 0
+
+    def test_write_lock_is_reentrant(self, temp_db):
+        """Test that write methods can be called while the write lock is held"""
+        with temp_db._write_lock:
+            temp_db.set_setting("nested", "ok")
+
+        assert temp_db.get_setting("nested") == "ok"
+
+    def test_reads_use_per_thread_read_only_connection(self, temp_db):
+        """Test that reads go through a separate read-only connection per thread"""
+        temp_db.save_activity(
+            "App", "Title", datetime(2024, 1, 15, 10, 0), datetime(2024, 1, 15, 11, 0)
+        )
+
+        main_conn = temp_db._read_conn()
+        assert main_conn is not temp_db.conn
+        assert temp_db._read_conn() is main_conn
+
+        with pytest.raises(sqlite3.OperationalError):
+            main_conn.execute("DELETE FROM activities")
+
+        results = {}
+
+        def read_in_thread():
+            results["conn"] = temp_db._read_conn()
+            results["activities"] = temp_db.get_activities()
+
+        thread = threading.Thread(target=read_in_thread)
+        thread.start()
+        thread.join()
+
+        assert results["conn"] is not main_conn
+        assert len(results["activities"]) == 1
+
+    def test_read_connections_closed_when_threads_exit(self, temp_db):
+        """Test that short-lived threads do not leave read connections open"""
+        temp_db._read_conn()
+        opened = []
+
+        def read_in_thread():
+            opened.append(temp_db._read_conn())
+            temp_db.get_activities()
+
+        for _ in range(20):
+            thread = threading.Thread(target=read_in_thread)
+            thread.start()
+            thread.join()
+
+        # Only the main thread's connection is left
+        assert len(temp_db._read_conns) == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+
+    def test_projects_cache_tracks_writes(self, temp_db):
+        """Test that cached projects reflect creates, deletes and last_used updates"""
+        names = {p["name"] for p in temp_db.get_projects()}
+
+        project_id = temp_db.create_project("Cached")
+        assert {p["name"] for p in temp_db.get_projects()} == names | {"Cached"}
+
+        # Returned dicts are copies of the cache
+        temp_db.get_projects()[0]["name"] = "Changed"
+        assert "Changed" not in {p["name"] for p in temp_db.get_projects()}
+
+        temp_db.assign_activities_by_timerange(
+            datetime(2024, 1, 1), datetime(2024, 1, 2), "App", project_id
+        )
+        projects = {p["id"]: p for p in temp_db.get_projects()}
+        assert projects[project_id]["last_used"] is not None
+
+        temp_db.delete_project(project_id)
+        assert {p["name"] for p in temp_db.get_projects()} == names
+
+    def test_projects_cache_ignores_read_racing_with_write(self, temp_db):
+        """Test that a read overtaken by create_project does not cache the old list"""
+        names = {p["name"] for p in temp_db.get_projects()}
+        temp_db._projects_cache = None
+        read_conn = temp_db._read_conn()
+
+        class RacingCursor:
+            """Reads the old rows, then lets create_project commit before returning"""
+
+            def __init__(self):
+                self.cursor = read_conn.cursor()
+
+            def execute(self, sql):
+                self.cursor.execute(sql)
+
+            def fetchall(self):
+                rows = self.cursor.fetchall()
+                temp_db.create_project("Racing")
+                return rows
+
+            def close(self):
+                self.cursor.close()
+
+        class RacingConn:
+            def cursor(self):
+                return RacingCursor()
+
+        original_read_conn = temp_db._read_conn
+        temp_db._read_conn = lambda: RacingConn()
+        try:
+            assert {p["name"] for p in temp_db.get_projects()} == names
+        finally:
+            temp_db._read_conn = original_read_conn
+
+        assert {p["name"] for p in temp_db.get_projects()} == names | {"Racing"}
+
+    def test_social_media_project_id_cached(self, temp_db):
+        """Test that the Social Media project ID is resolved once and reset on delete"""
+        project_id = temp_db.get_social_media_project_id()
+        projects = {p["name"]: p["id"] for p in temp_db.get_projects()}
+        assert project_id == projects["Social Media"]
+
+        temp_db.delete_project(project_id)
+
+        assert temp_db.get_social_media_project_id() is None
+        assert "Social Media" not in {p["name"] for p in temp_db.get_projects()}
+
+    def test_settings_cache_tracks_updates(self, temp_db):
+        """Test that cached settings reflect writes and missing keys use the default"""
+        assert temp_db.get_setting("theme", "default") == "default"
+
+        temp_db.set_setting("theme", "dark")
+        assert temp_db.get_setting("theme", "default") == "dark"
+        assert temp_db.get_setting("other") is None
+
+    def test_failed_write_rolls_back(self, temp_db):
+        """Test that a failing write leaves no open transaction behind"""
+        temp_db.create_project("Duplicate")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.create_project("Duplicate")
+
+        assert not temp_db.conn.in_transaction
+        assert [p["name"] for p in temp_db.get_projects()].count("Duplicate") == 1
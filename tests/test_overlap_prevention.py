@@ -212,3 +212,102 @@ def test_idle_activity_overlap(temp_db):
     act2 = [a for a in activities if a['id'] == id2][0]
     assert act2['duration'] == 120
     assert act2['is_idle'] == 0
+
+
+def test_batch_save_resolves_overlaps(temp_db):
+    """Test: Überlappungen innerhalb eines Batches werden aufgelöst"""
+    id1, id2 = temp_db.save_activities([
+        {
+            "app_name": "App1",
+            "window_title": "Window1",
+            "start_time": datetime(2025, 10, 3, 10, 0, 0),
+            "end_time": datetime(2025, 10, 3, 10, 2, 0),
+        },
+        {
+            "app_name": "App2",
+            "window_title": "Window2",
+            "start_time": datetime(2025, 10, 3, 10, 1, 0),
+            "end_time": datetime(2025, 10, 3, 10, 3, 0),
+        },
+    ])
+
+    activities = {a['id']: a for a in temp_db.get_activities()}
+    assert activities[id1]['duration'] == 60
+    assert activities[id2]['duration'] == 120
+
+
+def test_long_activity_overlap_detected(temp_db):
+    """Test: Auch sehr lange Aktivitäten werden bei Überlappung gekürzt"""
+    # Activity 1: 08:00:00 - 12:00:00 (4 Stunden)
+    start1 = datetime(2025, 10, 3, 8, 0, 0)
+    end1 = datetime(2025, 10, 3, 12, 0, 0)
+
+    # Activity 2: 11:00:00 - 11:30:00
+    start2 = datetime(2025, 10, 3, 11, 0, 0)
+    end2 = datetime(2025, 10, 3, 11, 30, 0)
+
+    id1 = temp_db.save_activity("App1", "Window1", start1, end1)
+    temp_db.save_activity("App2", "Window2", start2, end2)
+
+    act1 = [a for a in temp_db.get_activities() if a['id'] == id1][0]
+    assert act1['duration'] == 3 * 3600
+
+
+def test_long_activity_from_existing_database(temp_db):
+    """Test: Lange Aktivitäten aus einer bestehenden Datenbank werden berücksichtigt"""
+    start1 = datetime(2025, 10, 3, 8, 0, 0)
+    id1 = temp_db.save_activity("App1", "Window1", start1, start1 + timedelta(hours=5))
+
+    # Simulate a fresh process on the same database
+    temp_db._max_duration = None
+
+    start2 = datetime(2025, 10, 3, 12, 0, 0)
+    temp_db.save_activity("App2", "Window2", start2, start2 + timedelta(minutes=5))
+
+    act1 = [a for a in temp_db.get_activities() if a['id'] == id1][0]
+    assert act1['duration'] == 4 * 3600
+
+
+def test_overlap_with_fractional_seconds(temp_db):
+    """Test: Gekürzte Dauer wird wie int(total_seconds()) abgeschnitten"""
+    # Activity 1: 10:00:00.700 - 10:02:00.700
+    start1 = datetime(2025, 10, 3, 10, 0, 0, 700000)
+    id1 = temp_db.save_activity("App1", "Window1", start1, start1 + timedelta(minutes=2))
+
+    # Activity 2 beginnt 59.8 Sekunden später
+    start2 = datetime(2025, 10, 3, 10, 1, 0, 500000)
+    temp_db.save_activity("App2", "Window2", start2, start2 + timedelta(minutes=2))
+
+    act1 = [a for a in temp_db.get_activities() if a['id'] == id1][0]
+    assert act1['duration'] == 59
+
+
+def test_sub_second_overlap_deletes_previous(temp_db):
+    """Test: Aktivität, die weniger als eine Sekunde vorher beginnt, wird gelöscht"""
+    start1 = datetime(2025, 10, 3, 10, 0, 0, 200000)
+    temp_db.save_activity("App1", "Window1", start1, start1 + timedelta(minutes=2))
+
+    start2 = datetime(2025, 10, 3, 10, 0, 0, 900000)
+    id2 = temp_db.save_activity("App2", "Window2", start2, start2 + timedelta(minutes=2))
+
+    activities = temp_db.get_activities()
+    assert [a['id'] for a in activities] == [id2]
+
+
+def test_sequential_activities_skip_overlap_statements(temp_db):
+    """Test: Chronologisch geschriebene Aktivitäten lösen keine Überlappungs-Statements aus"""
+    statements = []
+    temp_db.conn.set_trace_callback(statements.append)
+
+    start = datetime(2025, 10, 3, 10, 0, 0)
+    for i in range(3):
+        begin = start + timedelta(minutes=i)
+        temp_db.save_activity("App", f"Window{i}", begin, begin + timedelta(minutes=1))
+
+    temp_db.conn.set_trace_callback(None)
+    assert not [sql for sql in statements if "UPDATE activities" in sql or "DELETE FROM" in sql]
+
+    # Ein zurückdatierter Eintrag prüft weiterhin auf Überlappungen
+    temp_db.save_activity("App", "Late", start + timedelta(seconds=30), start + timedelta(minutes=1))
+    durations = {a['window_title']: a['duration'] for a in temp_db.get_activities()}
+    assert durations["Window0"] == 30
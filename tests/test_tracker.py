@@ -2,7 +2,8 @@
 Tests for activity tracker
 """
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+import sqlite3
 import time
 from unittest.mock import Mock, patch
 
@@ -22,6 +23,7 @@ class TestActivityTracker:
             "process_path": "C:\\Program Files\\VSCode\\Code.exe",
         }
         mock.get_idle_time.return_value = 0
+        mock.supports_foreground_hook = False
         return mock
 
     def test_tracker_initialization(self, mock_db):
@@ -233,3 +235,200 @@ class TestActivityTracker:
 
             # Should not raise any errors
             assert not tracker.is_running
+
+    def test_activities_buffered_until_flush(self, mock_db, mock_platform_tracker):
+        """Test that finished activities are written in batches"""
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get:
+            mock_get.return_value = mock_platform_tracker
+
+            tracker = ActivityTracker(mock_db, poll_interval=0.1, flush_size=2)
+            tracker._current_activity = {
+                "app_name": "Code.exe",
+                "window_title": "main.py",
+                "process_path": "C:\\Code.exe",
+            }
+            tracker._start_time = datetime.now() - timedelta(seconds=5)
+            tracker._start_monotonic = time.monotonic() - 5
+
+            tracker._save_current_activity()
+            assert mock_db.get_activities() == []
+
+            tracker._start_time = datetime.now() - timedelta(seconds=2)
+            tracker._start_monotonic = time.monotonic() - 2
+            tracker._save_current_activity()
+            assert len(mock_db.get_activities()) == 2
+
+    def test_flush_notifies_listener(self, mock_db, mock_platform_tracker):
+        """Test that on_activities_saved is called once per written batch"""
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get:
+            mock_get.return_value = mock_platform_tracker
+
+            tracker = ActivityTracker(mock_db, flush_size=2)
+            tracker.on_activities_saved = Mock()
+            tracker._current_activity = {
+                "app_name": "Code.exe",
+                "window_title": "main.py",
+                "process_path": "C:\\Code.exe",
+            }
+            tracker._start_time = datetime.now() - timedelta(seconds=5)
+            tracker._start_monotonic = time.monotonic() - 5
+
+            tracker._save_current_activity()
+            tracker.on_activities_saved.assert_not_called()
+
+            tracker._save_current_activity()
+            tracker.on_activities_saved.assert_called_once_with()
+
+            # Nothing pending, nothing to report
+            tracker._flush_pending()
+            tracker.on_activities_saved.assert_called_once_with()
+
+    def test_failed_flush_is_retried(self, mock_db, mock_platform_tracker):
+        """Test that a batch whose write fails stays buffered for the next flush"""
+        save_activities = mock_db.save_activities
+        mock_db.save_activities = Mock(
+            side_effect=sqlite3.OperationalError("database is locked")
+        )
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get:
+            mock_get.return_value = mock_platform_tracker
+
+            tracker = ActivityTracker(mock_db, flush_size=10)
+            tracker._current_activity = {
+                "app_name": "Code.exe",
+                "window_title": "main.py",
+                "process_path": "C:\\Code.exe",
+            }
+            tracker._start_time = datetime.now() - timedelta(seconds=5)
+            tracker._start_monotonic = time.monotonic() - 5
+            tracker._save_current_activity()
+
+            with pytest.raises(sqlite3.OperationalError):
+                tracker._flush_pending()
+            assert mock_db.get_activities() == []
+
+            mock_db.save_activities.side_effect = save_activities
+            tracker._flush_pending()
+            assert len(mock_db.get_activities()) == 1
+
+    def test_stop_flushes_and_assigns_social_media(self, mock_db, mock_platform_tracker):
+        """Test that stop() writes buffered activities and assigns social media"""
+        social_media_id = mock_db.create_project("Social Media")
+        mock_platform_tracker.get_active_window.return_value = {
+            "app_name": "chrome.exe",
+            "window_title": "YouTube - Google Chrome",
+            "process_path": "C:\\chrome.exe",
+        }
+
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get, \
+             patch("core.tracker.should_ignore_activity", return_value=False):
+            mock_get.return_value = mock_platform_tracker
+
+            tracker = ActivityTracker(mock_db, poll_interval=0.05)
+            tracker.start()
+            time.sleep(1.2)
+            tracker.stop()
+
+            activities = mock_db.get_activities()
+            assert len(activities) == 1
+            assert activities[0]["project_id"] == social_media_id
+
+    def test_foreground_hook_replaces_polling(self, mock_db, mock_platform_tracker):
+        """Test that a platform foreground hook drives the loop instead of polling"""
+        callbacks = []
+        mock_platform_tracker.supports_foreground_hook = True
+        mock_platform_tracker.start_foreground_hook.side_effect = (
+            lambda callback: callbacks.append(callback) or True
+        )
+        mock_platform_tracker.is_audio_playing.return_value = False
+
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get, \
+             patch("core.tracker.should_ignore_activity", return_value=False):
+            mock_get.return_value = mock_platform_tracker
+
+            tracker = ActivityTracker(mock_db, poll_interval=0.01, idle_check_interval=10)
+            tracker.start()
+            time.sleep(0.3)
+
+            # No events: only the initial iteration ran
+            assert mock_platform_tracker.get_active_window.call_count == 1
+            assert tracker.get_current_activity()["app_name"] == "Code.exe"
+
+            mock_platform_tracker.get_active_window.return_value = {
+                "app_name": "chrome.exe",
+                "window_title": "GitHub - Chrome",
+                "process_path": "C:\\chrome.exe",
+            }
+            callbacks[0]()
+            time.sleep(0.3)
+
+            assert tracker.get_current_activity()["app_name"] == "chrome.exe"
+
+            tracker.stop()
+            assert not tracker.tracker_thread.is_alive()
+            mock_platform_tracker.stop_foreground_hook.assert_called_once()
+
+    def test_stop_does_not_wait_for_poll_interval(self, mock_db, mock_platform_tracker):
+        """Test that stop() interrupts the wait between polls"""
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get:
+            mock_get.return_value = mock_platform_tracker
+
+            tracker = ActivityTracker(mock_db, poll_interval=30)
+            tracker.start()
+            time.sleep(0.1)
+
+            started = time.monotonic()
+            tracker.stop()
+
+            assert time.monotonic() - started < 1
+            assert not tracker.tracker_thread.is_alive()
+
+    def test_poll_interval_backs_off_without_input(self, mock_db, mock_platform_tracker):
+        """Test that polling slows down while nothing changes and resets on input"""
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get:
+            mock_get.return_value = mock_platform_tracker
+            mock_platform_tracker.get_idle_time.return_value = 20
+
+            tracker = ActivityTracker(mock_db, poll_interval=0.02, max_poll_interval=0.1)
+            tracker.start()
+            time.sleep(0.8)
+            assert tracker._poll_delay == pytest.approx(0.1)
+
+            # Fresh input resets the interval
+            mock_platform_tracker.get_idle_time.return_value = 0
+            time.sleep(0.3)
+            assert tracker._poll_delay == 0.02
+
+            tracker.stop()
+
+    def test_title_flicker_shorter_than_a_tick_is_ignored(self, mock_db, mock_platform_tracker):
+        """Test that a window seen for a single tick does not become an activity"""
+        editor = mock_platform_tracker.get_active_window.return_value
+        flicker = dict(editor, window_title="● main.py - VSCode")
+        windows = iter([editor] * 25 + [flicker])
+        mock_platform_tracker.get_active_window.side_effect = lambda: next(windows, editor)
+
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get, \
+             patch("core.tracker.should_ignore_activity", return_value=False):
+            mock_get.return_value = mock_platform_tracker
+
+            tracker = ActivityTracker(mock_db, poll_interval=0.05)
+            tracker.start()
+            time.sleep(2.8)
+            tracker.stop()
+
+            # Without debouncing the editor activity would be split in two
+            activities = mock_db.get_activities()
+            assert [a["window_title"] for a in activities] == ["main.py - VSCode"]
+
+    def test_idle_time_read_less_often_while_active(self, mock_db, mock_platform_tracker):
+        """Test that idle time is not read on every poll far below the threshold"""
+        with patch("core.tracker.ActivityTracker._get_platform_tracker") as mock_get:
+            mock_get.return_value = mock_platform_tracker
+
+            tracker = ActivityTracker(mock_db, poll_interval=0.02, idle_threshold=300)
+            tracker.start()
+            time.sleep(0.5)
+            tracker.stop()
+
+            polls = mock_platform_tracker.get_active_window.call_count
+            assert mock_platform_tracker.get_idle_time.call_count <= polls // 5 + 1